@@ -0,0 +1,34 @@
+"""
+Benchmark of cold import of solid_i18n modules.
+"""
+import os
+import subprocess
+import sys
+
+from .utils import report
+
+MODULES = ("solid_i18n", "solid_i18n.middleware", "solid_i18n.urls")
+
+
+def import_time(module):
+    """
+    Cumulative import time of module in clean interpreter, microseconds.
+    """
+    env = dict(os.environ)
+    env.pop("DJANGO_SETTINGS_MODULE", None)
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import %s" % module],
+        env=env, stderr=subprocess.PIPE, universal_newlines=True, check=True,
+    ).stderr
+    for line in output.splitlines():
+        fields = line[len("import time:"):].split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1])
+
+
+def bench_import():
+    for module in MODULES:
+        report(
+            "import", {"module": module},
+            cumulative=min(import_time(module) for i in range(5)),
+        )
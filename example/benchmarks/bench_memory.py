@@ -0,0 +1,36 @@
+"""
+Benchmarks of solid_i18n.memory storage.
+"""
+from threading import local
+
+from solid_i18n import memory
+
+from .utils import measure, report
+
+
+def bench_memory_access():
+    """
+    Compare ContextVar storage with previously used threading.local.
+    """
+    thread_local = local()
+
+    def local_set_get():
+        thread_local.value = "ru"
+        getattr(thread_local, "value", None)
+
+    def contextvar_set_get_reset():
+        token = memory.set_language_from_path("ru")
+        memory.get_language_from_path()
+        memory.reset_language_from_path(token)
+
+    report(
+        "memory set+get",
+        threading_local=measure(local_set_get, number=100000),
+        contextvar=measure(contextvar_set_get_reset, number=100000),
+    )
+    report(
+        "memory get",
+        threading_local=measure(
+            lambda: getattr(thread_local, "value", None), number=100000),
+        contextvar=measure(memory.get_language_from_path, number=100000),
+    )
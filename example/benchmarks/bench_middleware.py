@@ -0,0 +1,145 @@
+"""
+Benchmarks of SolidLocaleMiddleware.
+
+Run them with `tox -e bench`.
+"""
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import override_settings
+from django.utils import translation
+
+from solid_i18n.middleware import SolidLocaleMiddleware, get_language_from_path
+from solid_i18n.urls import is_language_prefix_patterns_used
+
+from .utils import flag_combinations, flags_id, get_languages, measure, report
+
+PATHS = ("/about/", "/en/about/", "/ru/about/")
+ACCEPT_LANGUAGE = "ru-RU,ru;q=0.8,en;q=0.6"
+
+
+def middleware_cycle(middleware, request):
+    def cycle():
+        request.__dict__.pop("solid_i18n_resolution", None)
+        middleware.process_request(request)
+        middleware.process_response(request, HttpResponse())
+    return cycle
+
+
+def middleware_request(middleware, request):
+    def process_request():
+        request.__dict__.pop("solid_i18n_resolution", None)
+        middleware.process_request(request)
+    return process_request
+
+
+def report_middleware(params):
+    middleware = SolidLocaleMiddleware(lambda request: HttpResponse())
+    for path in PATHS:
+        request = RequestFactory().get(path, HTTP_ACCEPT_LANGUAGE=ACCEPT_LANGUAGE)
+        with translation.override("en"):
+            report(
+                "middleware",
+                dict(params, path=path),
+                process_request=measure(
+                    middleware_request(middleware, request), number=1000, repeat=3),
+                cycle=measure(
+                    middleware_cycle(middleware, request), number=1000, repeat=3),
+            )
+
+
+@pytest.mark.parametrize("flags", list(flag_combinations()), ids=flags_id)
+def bench_middleware_flags(flags):
+    with override_settings(**flags):
+        report_middleware(flags)
+
+
+@pytest.mark.parametrize("languages", (2, 20, 200))
+def bench_middleware_languages(languages):
+    with override_settings(LANGUAGES=get_languages(languages)):
+        report_middleware({"languages": languages})
+
+
+@pytest.mark.parametrize("flags", list(flag_combinations()), ids=flags_id)
+def bench_perform_redirect(flags):
+    middleware = SolidLocaleMiddleware(lambda request: HttpResponse())
+    with override_settings(**flags):
+        for path, language in (
+            ("/about/", "ru"), ("/about", "ru"), ("/missing/", "ru"), ("/en/about/", "")
+        ):
+            request = RequestFactory().get(path)
+            with translation.override(language or "en"):
+                report(
+                    "perform_redirect",
+                    dict(flags, path=path, language=language),
+                    perform_redirect=measure(
+                        lambda: middleware.perform_redirect(request, language),
+                        number=1000, repeat=3),
+                )
+
+
+@override_settings(SOLID_I18N_PREFIX_STRICT=False)
+def bench_path_resolution_reuse():
+    """
+    Per request saving of storing PathResolution in request: process_response
+    doesn't search path language and i18n patterns again.
+    """
+    middleware = SolidLocaleMiddleware(lambda request: HttpResponse())
+    config = middleware.config
+    for path in ("/about/", "/ru/about/", "/pt-broughton/slug/"):
+        request = RequestFactory().get(path)
+        urlconf = config.root_urlconf
+
+        def recompute():
+            get_language_from_path(request.path_info, config)
+            is_language_prefix_patterns_used(urlconf)
+
+        with translation.override("en"):
+            report(
+                "path resolution reuse",
+                {"path": path},
+                cycle=measure(middleware_cycle(middleware, request)),
+                saved=measure(recompute),
+            )
+
+
+@override_settings(SOLID_I18N_EXCLUDE_PREFIXES=("/static/", "/healthz", "/api/"))
+def bench_excluded_prefixes():
+    middleware = SolidLocaleMiddleware(lambda request: HttpResponse())
+    response = HttpResponse()
+    for path in ("/healthz", "/about/"):
+        request = RequestFactory().get(path, HTTP_ACCEPT_LANGUAGE=ACCEPT_LANGUAGE)
+
+        def cycle():
+            request.__dict__.pop("solid_i18n_resolution", None)
+            middleware.process_request(request)
+            middleware.process_response(request, response)
+
+        with translation.override("en"):
+            report("excluded prefixes", {"path": path}, cycle=measure(cycle))
+
+
+def legacy_get_language_from_path(path, config):
+    """
+    get_language_from_path, as it was before LanguagePrefixDetector.
+    """
+    if config.prefix_strict and not config.strict_prefix_re.match(path):
+        return None
+    return translation.trans_real.get_language_from_path(path, strict=config.prefix_strict)
+
+
+@pytest.mark.parametrize("strict", (False, True))
+@pytest.mark.parametrize("languages", (2, 20, 300))
+def bench_language_prefix_detection(languages, strict):
+    with override_settings(
+        LANGUAGES=get_languages(languages), SOLID_I18N_PREFIX_STRICT=strict
+    ):
+        middleware = SolidLocaleMiddleware(lambda request: HttpResponse())
+        config = middleware.config
+        for path in ("/about/", "/ru/about/", "/x001/about/"):
+            report(
+                "language prefix detection",
+                {"languages": languages, "strict": strict, "path": path},
+                regex=measure(lambda: legacy_get_language_from_path(path, config)),
+                detector=measure(lambda: get_language_from_path(path, config)),
+            )
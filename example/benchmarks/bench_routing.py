@@ -0,0 +1,56 @@
+"""
+Benchmarks of per-urlconf routing tables with many host-specific urlconfs.
+"""
+import itertools
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import clear_url_caches, get_resolver
+from django.utils import translation
+
+from solid_i18n.middleware import SolidLocaleMiddleware
+from solid_i18n.routing import get_routing_table, routing_tables
+from solid_i18n.urlresolvers import SolidLocalePrefixPattern
+
+from .utils import build_urlconf, measure, report
+
+
+def scan_patterns(urlconf):
+    """
+    Detection of solid_i18n_patterns, as it was done without routing tables.
+    """
+    resolver = get_resolver(urlconf)
+    for url_pattern in resolver.url_patterns:
+        if isinstance(url_pattern.pattern, SolidLocalePrefixPattern):
+            return True
+    return False
+
+
+@pytest.mark.parametrize("tenants", (10, 300))
+def bench_routing_tables(tenants):
+    urlconfs = [build_urlconf(20) for i in range(tenants)]
+    cycle = itertools.cycle(urlconfs)
+    # default SOLID_I18N_PREFIX_PATTERNS_CACHE_SIZE keeps all tenants
+    routing_tables.clear()
+    cold = measure(lambda: get_routing_table(next(cycle)), number=tenants, repeat=1)
+    middleware = SolidLocaleMiddleware(lambda request: HttpResponse())
+    request = RequestFactory().get("/ru/page1/slug/")
+
+    def middleware_cycle():
+        request.urlconf = next(cycle)
+        request.solid_i18n_resolution = None
+        middleware.process_request(request)
+        middleware.process_response(request, HttpResponse())
+
+    with translation.override("en"):
+        report(
+            "routing tables",
+            {"tenants": tenants},
+            cold_compile=cold,
+            lookup=measure(lambda: get_routing_table(next(cycle)), number=10000, repeat=3),
+            scan=measure(lambda: scan_patterns(next(cycle)), number=10000, repeat=3),
+            middleware=measure(middleware_cycle, number=2000, repeat=3),
+        )
+    routing_tables.clear()
+    clear_url_caches()
@@ -0,0 +1,68 @@
+"""
+Benchmarks of SolidI18nSitemap.
+"""
+import time
+
+from django.contrib.sitemaps import Sitemap
+from django.test.utils import override_settings
+from django.urls import clear_url_caches, reverse
+
+from solid_i18n.sitemaps import SolidI18nSitemap
+
+from .utils import build_urlconf, get_languages, report
+
+
+class Site(object):
+    domain = "example.com"
+
+
+class SolidPagesSitemap(SolidI18nSitemap):
+    protocol = "https"
+
+    def __init__(self, count):
+        self.count = count
+
+    def items(self):
+        return range(self.count)
+
+    def location(self, item):
+        return reverse("page0", kwargs={"slug": "item-%d" % item})
+
+
+class DjangoPagesSitemap(Sitemap):
+    protocol = "https"
+    i18n = True
+    alternates = True
+    x_default = True
+    items = SolidPagesSitemap.items
+    location = SolidPagesSitemap.location
+    __init__ = SolidPagesSitemap.__init__
+
+
+def generate(sitemap):
+    """
+    Generate all pages of sitemap, returns (url count, seconds).
+    """
+    started = time.perf_counter()
+    count = 0
+    for page in sitemap.paginator.page_range:
+        for url in sitemap.get_urls(page=page, site=Site()):
+            count += 1
+    return count, time.perf_counter() - started
+
+
+def bench_sitemap():
+    languages = 20
+    urlconf = build_urlconf(1)
+    with override_settings(ROOT_URLCONF=urlconf, LANGUAGES=get_languages(languages)):
+        # django sitemap is measured on smaller number of items
+        django_urls, django_seconds = generate(DjangoPagesSitemap(500))
+        solid_urls, solid_seconds = generate(SolidPagesSitemap(100000))
+        report(
+            "sitemap",
+            {"items": 100000, "languages": languages},
+            django_per_url=django_seconds / django_urls * 1e6,
+            solid_per_url=solid_seconds / solid_urls * 1e6,
+            solid_total=solid_seconds * 1e6,
+        )
+    clear_url_caches()
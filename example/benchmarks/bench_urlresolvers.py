@@ -0,0 +1,157 @@
+"""
+Benchmarks of SolidLocalePrefixPattern and reverse() inside solid_i18n_patterns.
+"""
+import random
+import threading
+import time
+
+import pytest
+from django.conf import settings
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import clear_url_caches, reverse
+from django.utils import translation
+from django.utils.translation import get_language
+
+from solid_i18n.memory import reset_language_from_path, set_language_from_path
+from solid_i18n.urlresolvers import SolidLocalePrefixPattern
+from solid_i18n.urls import is_language_prefix_patterns_used, reverse_all_languages
+
+from .utils import build_urlconf, flag_combinations, flags_id, get_languages, measure, report
+
+
+def legacy_match(pattern, path):
+    """
+    SolidLocalePrefixPattern.match, as it was before precomputed match table.
+    """
+    language_code = get_language() or settings.LANGUAGE_CODE
+    language_prefix = pattern.language_prefix
+    if language_code == settings.LANGUAGE_CODE and not pattern.prefix_default_language:
+        if path == language_code + "/":
+            if not settings.SOLID_I18N_HANDLE_DEFAULT_PREFIX:
+                return None
+    language_prefix = pattern.language_prefix
+    if path.startswith(language_prefix):
+        return path[len(language_prefix) :], (), {}
+    if language_code != settings.LANGUAGE_CODE and settings.SOLID_I18N_USE_REDIRECTS is True:
+        return None
+    return path[0:], (), {}
+
+
+@pytest.mark.parametrize("languages", (2, 20, 200))
+def bench_prefix_pattern_match(languages):
+    with override_settings(LANGUAGES=get_languages(languages)):
+        pattern = SolidLocalePrefixPattern(prefix_default_language=False)
+        for language, path in (("en", "about/"), ("ru", "ru/about/")):
+            with translation.override(language):
+                report(
+                    "match",
+                    {"languages": languages, "path": path},
+                    legacy=measure(lambda: legacy_match(pattern, path)),
+                    table=measure(lambda: pattern.match(path)),
+                )
+
+
+@pytest.mark.parametrize("flags", list(flag_combinations()), ids=flags_id)
+def bench_prefix_pattern_match_flags(flags):
+    with override_settings(**flags):
+        pattern = SolidLocalePrefixPattern(prefix_default_language=False)
+        for language, path in (("en", "about/"), ("en", "en/about/"), ("ru", "ru/about/")):
+            with translation.override(language):
+                report(
+                    "match",
+                    dict(flags, path=path, language=language),
+                    table=measure(lambda: pattern.match(path)),
+                )
+
+
+def reverse_page(language, language_from_path):
+    def reverse_with_path_language():
+        token = set_language_from_path(language_from_path)
+        try:
+            return reverse("page5", kwargs={"slug": "slug"})
+        finally:
+            reset_language_from_path(token)
+    return reverse_with_path_language
+
+
+@pytest.mark.parametrize("patterns", (10, 100, 1000))
+@pytest.mark.parametrize("languages", (2, 20, 200))
+@pytest.mark.parametrize("handle_default_prefix", (False, True))
+def bench_reverse(patterns, languages, handle_default_prefix):
+    urlconf = build_urlconf(patterns)
+    with override_settings(
+        ROOT_URLCONF=urlconf,
+        LANGUAGES=get_languages(languages),
+        SOLID_I18N_HANDLE_DEFAULT_PREFIX=handle_default_prefix,
+    ):
+        is_language_prefix_patterns_used(urlconf)
+        for language, language_from_path in (("en", None), ("en", "en"), ("ru", "ru")):
+            with translation.override(language):
+                func = reverse_page(language, language_from_path)
+                func()  # populate reverse data
+                report(
+                    "reverse",
+                    {
+                        "patterns": patterns,
+                        "languages": languages,
+                        "handle_default_prefix": handle_default_prefix,
+                        "language": language,
+                        "language_from_path": language_from_path,
+                    },
+                    reverse=measure(func, number=2000, repeat=3),
+                )
+    clear_url_caches()
+
+
+@pytest.mark.parametrize("languages", (2, 30))
+def bench_reverse_all_languages(languages):
+    with override_settings(LANGUAGES=get_languages(languages)):
+        codes = [code for code, name in settings.LANGUAGES]
+
+        def reverse_loop():
+            urls = {}
+            for code in codes:
+                with translation.override(code):
+                    urls[code] = reverse("about")
+            return urls
+
+        report(
+            "reverse_all_languages",
+            {"languages": languages},
+            override_loop=measure(reverse_loop, number=200, repeat=3),
+            reverse_all_languages=measure(
+                lambda: reverse_all_languages("about"), number=200, repeat=3),
+        )
+
+
+@pytest.mark.parametrize("threads", (1, 8, 32))
+@override_settings(SOLID_I18N_HANDLE_DEFAULT_PREFIX=True)
+def bench_threaded_traffic(threads, requests_per_thread=100):
+    """
+    Whole request cycle through test client, mixed prefixed and
+    unprefixed paths, in concurrent threads sharing url patterns.
+    """
+    paths = ("/about/", "/en/about/", "/ru/about/", "/pt-br/about/")
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(seed):
+        client = Client()
+        worker_paths = random.Random(seed).choices(paths, k=requests_per_thread)
+        barrier.wait()
+        for path in worker_paths:
+            client.get(path)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    report(
+        "threaded traffic",
+        {"threads": threads},
+        request=elapsed / (threads * requests_per_thread) * 1e6,
+    )
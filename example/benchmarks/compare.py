@@ -0,0 +1,38 @@
+"""
+Compare two benchmark result files:
+
+    python example/benchmarks/compare.py old.json new.json
+"""
+import json
+import sys
+
+
+def load(path):
+    with open(path) as f:
+        data = json.load(f)
+    results = {}
+    for result in data["results"]:
+        params = json.dumps(result["params"], sort_keys=True)
+        for timing, value in result["timings_us"].items():
+            results[(result["name"], params, timing)] = value
+    return data["commit"], results
+
+
+def main(old_path, new_path, threshold=1.1):
+    old_commit, old = load(old_path)
+    new_commit, new = load(new_path)
+    print("%s -> %s" % (old_commit, new_commit))
+    regressions = 0
+    for key in sorted(set(old) & set(new)):
+        ratio = new[key] / old[key]
+        mark = ""
+        if ratio > threshold:
+            mark = "  REGRESSION"
+            regressions += 1
+        print("%s %s %s: %.3fus -> %.3fus (x%.2f)%s" % (
+            key + (old[key], new[key], ratio, mark)))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*sys.argv[1:3]))
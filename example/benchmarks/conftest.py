@@ -0,0 +1,34 @@
+import json
+import os
+import platform
+import subprocess
+
+import django
+
+from .utils import RESULTS
+
+
+def get_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Write results of benchmarks to json file, so they can be compared
+    between commits. File name is taken from SOLID_I18N_BENCHMARK_OUTPUT.
+    """
+    if not RESULTS:
+        return
+    output = os.environ.get("SOLID_I18N_BENCHMARK_OUTPUT", "benchmark-results.json")
+    with open(output, "w") as f:
+        json.dump({
+            "commit": get_commit(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "results": RESULTS,
+        }, f, indent=2, sort_keys=True)
@@ -0,0 +1,72 @@
+import itertools
+import timeit
+import types
+
+from django.urls import re_path as url
+from django.views.generic import TemplateView
+
+from solid_i18n.urls import solid_i18n_patterns
+
+# results of all benchmarks, run in current session
+RESULTS = []
+
+SOLID_FLAGS = (
+    "SOLID_I18N_USE_REDIRECTS",
+    "SOLID_I18N_HANDLE_DEFAULT_PREFIX",
+    "SOLID_I18N_DEFAULT_PREFIX_REDIRECT",
+    "SOLID_I18N_PREFIX_STRICT",
+)
+
+
+def measure(func, number=10000, repeat=5):
+    """
+    Return best time of one func call, in microseconds.
+    """
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def report(name, params=None, **timings):
+    """
+    Print timings and keep them for machine-readable output.
+    """
+    params = params or {}
+    RESULTS.append({"name": name, "params": params, "timings_us": timings})
+    print("\n%s %s: %s" % (
+        name,
+        " ".join("%s=%s" % (key, value) for key, value in sorted(params.items())),
+        ", ".join("%s=%.3fus" % (key, value) for key, value in sorted(timings.items())),
+    ))
+
+
+def get_languages(count):
+    languages = [("en", "English"), ("ru", "Russian")]
+    languages += [("x%03d" % i, "Language %d" % i) for i in range(count - 2)]
+    return languages
+
+
+def flag_combinations():
+    """
+    All combinations of SOLID_I18N_* boolean settings.
+    """
+    for values in itertools.product((False, True), repeat=len(SOLID_FLAGS)):
+        yield dict(zip(SOLID_FLAGS, values))
+
+
+def flags_id(flags):
+    return "-".join(
+        name.replace("SOLID_I18N_", "").lower() for name, value in flags.items() if value
+    ) or "defaults"
+
+
+def build_urlconf(count):
+    """
+    Urlconf module with `count` url patterns inside solid_i18n_patterns.
+    """
+    view = TemplateView.as_view(template_name="about.html")
+    urlconf = types.ModuleType("bench_urls_%d" % count)
+    urlconf.urlpatterns = solid_i18n_patterns(
+        *[url(r"^page%d/(?P<slug>[\w-]+)/$" % i, view, name="page%d" % i)
+          for i in range(count)]
+    )
+    return urlconf
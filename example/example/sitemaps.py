@@ -0,0 +1,13 @@
+from django.urls import reverse
+
+from solid_i18n.sitemaps import SolidI18nSitemap
+
+
+class PagesSitemap(SolidI18nSitemap):
+    protocol = "http"
+
+    def items(self):
+        return ["home", "about"]
+
+    def location(self, item):
+        return reverse(item)
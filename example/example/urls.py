@@ -1,8 +1,11 @@
+from django.contrib.sitemaps.views import sitemap
 from django.views.generic import TemplateView
 from django.urls import include, re_path as url
 
 from solid_i18n.urls import solid_i18n_patterns
 
+from .sitemaps import PagesSitemap
+
 urlpatterns = solid_i18n_patterns(
     url(r'^$', TemplateView.as_view(template_name="home.html"), name='home'),
     url(r'^about/$', TemplateView.as_view(template_name="about.html"),
@@ -14,4 +17,6 @@ urlpatterns += [
     url(r'^onelang/', TemplateView.as_view(template_name="onelang.html"),
         name='onelang'),
     url(r'^i18n/', include('django.conf.urls.i18n')),
+    url(r'^sitemap\.xml$', sitemap, {'sitemaps': {'pages': PagesSitemap}},
+        name='sitemap'),
 ]
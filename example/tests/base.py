@@ -1,4 +1,5 @@
 import sys
+from urllib.parse import urlencode
 try:
     from importlib import import_module
 except ImportError:
@@ -10,8 +11,9 @@ except ImportError:
         from imp import reload
     except ImportError:
         pass
+from asgiref.sync import async_to_sync
 from django.conf import settings
-from django.test import TestCase
+from django.test import AsyncClient, TestCase
 from django.urls import  clear_url_caches
 from django.utils import translation
 try:
@@ -20,8 +22,6 @@ except ImportError:
     class TransRealMixin(object):
         pass
 
-from solid_i18n.urls import is_language_prefix_patterns_used
-
 
 def reload_urlconf(urlconf=None, urls_attr='urlpatterns'):
     # http://codeinthehole.com/writing/how-to-reload-djangos-url-config/
@@ -30,13 +30,43 @@ def reload_urlconf(urlconf=None, urls_attr='urlpatterns'):
     return import_module(settings.ROOT_URLCONF)
 
 
+class SyncAsyncClient(AsyncClient):
+    """
+    AsyncClient with synchronous interface, so the same test cases
+    can be run through ASGI handler.
+    """
+
+    def generic(self, method, path, *args, **extra):
+        # AsyncRequestFactory turns extra keys into ASGI headers,
+        # so pass HTTP_* META keys as header names
+        for key in list(extra):
+            if key.startswith('HTTP_'):
+                extra[key[5:].lower().replace('_', '-')] = extra.pop(key)
+        return super(SyncAsyncClient, self).generic(
+            method, path, *args, **extra)
+
+    def post(self, path, data=None, **extra):
+        # multipart body can't be parsed by ASGIRequest of django < 4.1,
+        # so forms are sent url encoded
+        if isinstance(data, dict):
+            return self.generic(
+                'POST', path, urlencode(data),
+                'application/x-www-form-urlencoded', **extra)
+        return super(SyncAsyncClient, self).post(path, data, **extra)
+
+    def request(self, **request):
+        response = async_to_sync(super(SyncAsyncClient, self).request)(
+            **request)
+        response.request['PATH_INFO'] = request['path']
+        return response
+
+
 class URLTestCaseBase(TransRealMixin, TestCase):
 
     def setUp(self):
         # Make sure the cache is empty before we are doing our tests.
         super(URLTestCaseBase, self).tearDown()
         clear_url_caches()
-        is_language_prefix_patterns_used.cache_clear()
         reload_urlconf()
 
     def tearDown(self):
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+from unittest import mock
+
+from django.template import Context, Template
+from django.test import RequestFactory
+from django.urls import clear_url_caches, resolve, set_script_prefix
+
+from solid_i18n import alternates as alternates_module
+from solid_i18n.alternates import (
+    Alternate, alternates_cache, translate_url_all)
+from solid_i18n.context_processors import alternates
+
+from .base import URLTestCaseBase
+
+
+class AlternatesTestCase(URLTestCaseBase):
+    ABOUT_ALTERNATES = [
+        Alternate('ru', '/ru/about/'),
+        Alternate('en', '/about/'),
+        Alternate('my', '/my/about/'),
+        Alternate('pt-br', '/pt-br/about/'),
+        Alternate('x-default', '/about/'),
+    ]
+
+    def setUp(self):
+        super(AlternatesTestCase, self).setUp()
+        alternates_cache.clear()
+
+    def test_alternate_links(self):
+        response = self.client.get('/ru/about/')
+        content = response.content.decode('utf8')
+        self.assertIn(
+            '<link rel="alternate" hreflang="ru" '
+            'href="http://testserver/ru/about/">', content)
+        self.assertIn(
+            '<link rel="alternate" hreflang="x-default" '
+            'href="http://testserver/about/">', content)
+        self.assertEqual(
+            list(response.context['SOLID_I18N_ALTERNATES']),
+            self.ABOUT_ALTERNATES)
+
+    def test_cached(self):
+        with mock.patch.object(
+                alternates_module, 'reverse_all_languages',
+                wraps=alternates_module.reverse_all_languages) as reverse_mock:
+            self.client.get('/about/')
+            self.client.get('/ru/about/')
+            self.assertEqual(reverse_mock.call_count, 1)
+        self.assertEqual(alternates_cache.info().currsize, 1)
+
+    def test_context_processor_is_lazy(self):
+        request = RequestFactory().get('/about/')
+        request.resolver_match = resolve('/about/')
+        with mock.patch.object(alternates_module, 'reverse_all_languages',
+                               wraps=alternates_module.reverse_all_languages
+                               ) as reverse_mock:
+            context = alternates(request)
+            self.assertEqual(reverse_mock.call_count, 0)
+            self.assertEqual(
+                list(context['SOLID_I18N_ALTERNATES']), self.ABOUT_ALTERNATES)
+            self.assertEqual(reverse_mock.call_count, 1)
+
+    def test_noni18n_view(self):
+        response = self.client.get('/onelang/')
+        self.assertNotIn('rel="alternate"', response.content.decode('utf8'))
+        self.assertEqual(
+            list(response.context['SOLID_I18N_ALTERNATES']), [])
+
+    def test_cache_bound_to_resolver(self):
+        with mock.patch.object(
+                alternates_module, 'reverse_all_languages',
+                wraps=alternates_module.reverse_all_languages) as reverse_mock:
+            self.client.get('/about/')
+            clear_url_caches()
+            self.client.get('/about/')
+            self.assertEqual(reverse_mock.call_count, 2)
+
+    def test_not_reversible_view(self):
+        request = RequestFactory().get('/')
+        self.assertEqual(list(alternates(request)['SOLID_I18N_ALTERNATES']), [])
+
+
+class TranslateUrlAllTestCase(URLTestCaseBase):
+
+    def setUp(self):
+        super(TranslateUrlAllTestCase, self).setUp()
+        alternates_cache.clear()
+
+    def test_translate(self):
+        expected = {
+            'ru': '/ru/about/?page=2#top',
+            'en': '/about/?page=2#top',
+            'my': '/my/about/?page=2#top',
+            'pt-br': '/pt-br/about/?page=2#top',
+        }
+        self.assertEqual(translate_url_all('/about/?page=2#top'), expected)
+        self.assertEqual(translate_url_all('/ru/about/?page=2#top'), expected)
+        self.assertEqual(alternates_cache.info().hits, 1)
+
+    def test_absolute_url(self):
+        urls = translate_url_all('https://example.com/pt-br/')
+        self.assertEqual(urls['en'], 'https://example.com/')
+        self.assertEqual(urls['ru'], 'https://example.com/ru/')
+
+    def test_noni18n_url(self):
+        urls = translate_url_all('/onelang/')
+        self.assertEqual(set(urls.values()), set(['/onelang/']))
+
+    def test_not_found(self):
+        urls = translate_url_all('/ru/missing/')
+        self.assertEqual(set(urls.values()), set(['/ru/missing/']))
+        self.assertEqual(len(urls), 4)
+
+    def test_template_tag(self):
+        template = Template(
+            '{% load solid_i18n %}{% translate_urls as urls %}{{ urls.ru }}')
+        request = RequestFactory().get('/about/?q=1')
+        self.assertEqual(
+            template.render(Context({'request': request})), '/ru/about/?q=1')
+
+    def test_template_tag_script_prefix(self):
+        template = Template(
+            '{% load solid_i18n %}{% translate_urls as urls %}{{ urls.ru }}')
+        request = RequestFactory().get('/about/?q=1', SCRIPT_NAME='/app')
+        set_script_prefix('/app/')
+        try:
+            self.assertEqual(
+                template.render(Context({'request': request})),
+                '/app/ru/about/?q=1')
+        finally:
+            set_script_prefix('/')
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import override_settings
+from django.utils import translation
+
+from solid_i18n.middleware import SolidLocaleMiddleware
+
+from . import test_noni18n_urls, test_solid_urls
+from .base import SyncAsyncClient, URLTestCaseBase
+
+
+class AsgiNoni18nUrlsTestCase(test_noni18n_urls.Noni18nUrlsTestCase):
+    client_class = SyncAsyncClient
+
+
+class AsgiTranslationAccessTestCase(
+        test_solid_urls.TranslationAccessTestCase):
+    client_class = SyncAsyncClient
+
+
+class AsyncMiddlewareTestCase(URLTestCaseBase):
+
+    def test_process_in_event_loop_thread(self):
+        threads = []
+
+        class Middleware(SolidLocaleMiddleware):
+            def process_request(self, request):
+                threads.append(threading.get_ident())
+                return super(Middleware, self).process_request(request)
+
+            def process_response(self, request, response):
+                threads.append(threading.get_ident())
+                return super(Middleware, self).process_response(
+                    request, response)
+
+        async def get_response(request):
+            return HttpResponse(translation.get_language())
+
+        async def run():
+            middleware = Middleware(get_response)
+            self.assertTrue(asyncio.iscoroutinefunction(middleware))
+            response = await middleware(RequestFactory().get('/ru/about/'))
+            return threading.get_ident(), response
+
+        loop_thread, response = asyncio.run(run())
+        self.assertEqual(threads, [loop_thread, loop_thread])
+        self.assertEqual(response.content, b'ru')
+        self.assertEqual(response['Content-Language'], 'ru')
+
+    @override_settings(SOLID_I18N_DEFAULT_PREFIX_REDIRECT=True)
+    def test_default_prefix_redirect_before_view(self):
+        views = []
+
+        async def get_response(request):
+            views.append(request.path)
+            return HttpResponse()
+
+        async def run():
+            middleware = SolidLocaleMiddleware(get_response)
+            return await middleware(RequestFactory().get('/en/about/'))
+
+        response = asyncio.run(run())
+        self.assertEqual(response.status_code, 301)
+        self.assertEqual(response['Location'], '/about/')
+        self.assertEqual(views, [])
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import override_settings
+from django.urls import set_script_prefix
+from django.utils import translation
+
+from solid_i18n.cache import (
+    cache_page, get_language_variants, purge_language_variants)
+
+from .base import URLTestCaseBase
+
+CACHE_MIDDLEWARE = [
+    'solid_i18n.cache.SolidUpdateCacheMiddleware',
+    'solid_i18n.middleware.SolidLocaleMiddleware',
+    'solid_i18n.cache.SolidFetchFromCacheMiddleware',
+]
+
+
+@override_settings(
+    MIDDLEWARE=CACHE_MIDDLEWARE,
+    CACHES={'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    CACHE_MIDDLEWARE_SECONDS=60,
+    SOLID_I18N_USE_REDIRECTS=True,
+    SOLID_I18N_VARY_HEADER='X-Language',
+)
+class CacheMiddlewareTestCase(URLTestCaseBase):
+
+    def setUp(self):
+        super(CacheMiddlewareTestCase, self).setUp()
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+        super(CacheMiddlewareTestCase, self).tearDown()
+
+    def cached_pages(self):
+        return [key for key in cache._cache if '.cache_page.' in key]
+
+    def test_keyed_on_language(self):
+        for value in ('en', 'en-US', 'en-GB'):
+            response = self.client.get('/about/', HTTP_X_LANGUAGE=value)
+            self.assertEqual(response.status_code, 200)
+            self.assertIn('X-Language', response['Vary'])
+        self.assertEqual(len(self.cached_pages()), 1)
+        self.client.get('/ru/about/')
+        self.assertEqual(len(self.cached_pages()), 2)
+
+    def test_cached_response_keeps_vary(self):
+        self.client.get('/about/', HTTP_X_LANGUAGE='en')
+        response = self.client.get('/about/', HTTP_X_LANGUAGE='en-US')
+        self.assertIn('X-Language', response['Vary'])
+        self.assertEqual(len(self.cached_pages()), 1)
+
+    def test_purge_language_variants(self):
+        self.client.get('/about/', HTTP_X_LANGUAGE='en')
+        self.client.get('/ru/about/')
+        self.client.get('/')
+        self.assertEqual(len(self.cached_pages()), 3)
+        self.assertEqual(
+            purge_language_variants('http://testserver/ru/about/'), 2)
+        self.assertEqual(len(self.cached_pages()), 1)
+
+    def test_purge_with_script_name(self):
+        self.client.get('/about/', SCRIPT_NAME='/app', HTTP_X_LANGUAGE='en')
+        self.client.get('/my/about/', SCRIPT_NAME='/app')
+        self.assertEqual(len(self.cached_pages()), 2)
+        set_script_prefix('/app/')
+        try:
+            deleted = purge_language_variants(
+                'http://testserver/app/ru/about/')
+        finally:
+            set_script_prefix('/')
+        self.assertEqual(deleted, 2)
+        self.assertEqual(len(self.cached_pages()), 0)
+
+
+class LanguageVariantsTestCase(URLTestCaseBase):
+
+    def test_variants(self):
+        variants = get_language_variants('https://example.com/ru/about/?q=1')
+        self.assertIn(('https://example.com/about/?q=1', 'en'), variants)
+        self.assertIn(('https://example.com/about/?q=1', 'ru'), variants)
+        self.assertIn(('https://example.com/ru/about/?q=1', 'ru'), variants)
+        self.assertNotIn(('https://example.com/en/about/?q=1', 'en'), variants)
+        with override_settings(SOLID_I18N_HANDLE_DEFAULT_PREFIX=True):
+            self.assertIn(
+                ('https://example.com/en/about/', 'en'),
+                get_language_variants('https://example.com/about/'))
+
+    def test_variants_with_script_prefix(self):
+        set_script_prefix('/app/')
+        try:
+            variants = get_language_variants(
+                'https://example.com/app/ru/about/')
+        finally:
+            set_script_prefix('/')
+        self.assertIn(('https://example.com/app/about/', 'en'), variants)
+        self.assertIn(('https://example.com/app/my/about/', 'my'), variants)
+        self.assertIn(('https://example.com/app/ru/about/', 'ru'), variants)
+        self.assertNotIn(
+            ('https://example.com/ru/app/ru/about/', 'ru'), variants)
+
+
+@override_settings(
+    CACHES={'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    SOLID_I18N_VARY_HEADER='X-Language',
+)
+class CachePageTestCase(URLTestCaseBase):
+
+    def test_cache_page(self):
+        calls = []
+
+        @cache_page(60)
+        def view(request):
+            calls.append(request)
+            response = HttpResponse(translation.get_language())
+            response['Vary'] = 'X-Language'
+            return response
+
+        cache.clear()
+        for value in ('ru', 'ru-RU'):
+            request = RequestFactory().get('/about/', HTTP_X_LANGUAGE=value)
+            request.LANGUAGE_CODE = 'ru'
+            response = view(request)
+            self.assertEqual(response['Vary'], 'X-Language')
+        self.assertEqual(len(calls), 1)
+        cache.clear()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+from django.conf.locale import LANG_INFO
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import override_settings
+from django.urls import set_script_prefix
+from django.utils import translation
+from django.utils.translation import trans_real
+
+from solid_i18n.detector import LanguagePrefixDetector
+from solid_i18n.middleware import SolidLocaleMiddleware, get_language_from_path
+
+from .base import URLTestCaseBase
+
+PATHS = (
+    '/', '//', '/about/', '/x/ru/', '/ru', '/ru/', '/ru/about/', '/en/about/',
+    '/pt-br/x', '/pt/x', '/pt-broughton/slug/', '/my/', '/en-us/',
+    '/en-us-x/', '/de/', '/en@x/', '/ru-ru-ru-ru/', '/zh-hant/', '/ru-/',
+)
+
+
+class DetectorTestCase(URLTestCaseBase):
+
+    def get_detector(self):
+        return LanguagePrefixDetector(['en', 'ru', 'my', 'pt-br'])
+
+    def test_same_as_django(self):
+        detector = self.get_detector()
+        for path in PATHS:
+            self.assertEqual(
+                detector.detect(path)[0],
+                trans_real.get_language_from_path(path), path)
+
+    def test_detect(self):
+        detector = self.get_detector()
+        self.assertEqual(
+            detector.detect('/ru/about/'), ('ru', '/about/', True))
+        self.assertEqual(detector.detect('/ru'), ('ru', '/', True))
+        self.assertEqual(
+            detector.detect('/pt-broughton/slug/'), ('pt-br', '/slug/', False))
+        self.assertEqual(detector.detect('/about/'), (None, '/about/', False))
+
+    def test_strict(self):
+        detector = self.get_detector()
+        self.assertEqual(
+            detector.detect('/pt-br/x', strict=True), ('pt-br', '/x', True))
+        for path in ('/pt/x', '/pt-broughton/slug/', '/en-us/'):
+            self.assertEqual(detector.detect(path, strict=True),
+                             (None, path, False))
+
+    def test_case_insensitive(self):
+        detector = self.get_detector()
+        self.assertEqual(detector.detect('/RU/about/'), ('ru', '/about/', True))
+        self.assertEqual(
+            detector.detect('/Pt-BR/', strict=True), ('pt-br', '/', True))
+
+    def test_many_languages(self):
+        codes = sorted(
+            code for code, info in LANG_INFO.items() if 'fallback' not in info)
+        with override_settings(LANGUAGES=[(code, code) for code in codes]):
+            detector = LanguagePrefixDetector(codes)
+            for code in codes + ['pt-xx', 'zh-hk', 'sr-latn-xx']:
+                path = '/%s/about/' % code
+                self.assertEqual(
+                    detector.detect(path)[0],
+                    trans_real.get_language_from_path(path), path)
+
+    @override_settings(SOLID_I18N_PREFIX_STRICT=True)
+    def test_get_language_from_path(self):
+        self.assertEqual(get_language_from_path('/ru/about/'), 'ru')
+        self.assertIsNone(get_language_from_path('/pt-broughton/'))
+
+
+@override_settings(SOLID_I18N_DEFAULT_PREFIX_REDIRECT=True)
+class RemovePrefixTestCase(URLTestCaseBase):
+
+    def get_middleware(self):
+        return SolidLocaleMiddleware(lambda request: HttpResponse())
+
+    def test_remove_lang_from_path(self):
+        middleware = self.get_middleware()
+        self.assertEqual(middleware.remove_lang_from_path('/en/about/'), '/about/')
+        self.assertEqual(middleware.remove_lang_from_path('/en'), '/')
+        # not a language
+        self.assertEqual(middleware.remove_lang_from_path('/about/'), '/about/')
+
+    def test_redirect_with_script_prefix(self):
+        middleware = self.get_middleware()
+        request = RequestFactory().get('/en/about/', SCRIPT_NAME='/site')
+        set_script_prefix('/site/')
+        try:
+            with translation.override('en'):
+                response = middleware.perform_redirect(
+                    request, '', is_permanent=True)
+        finally:
+            set_script_prefix('/')
+        self.assertEqual(response['Location'], '/site/about/')
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+import os
+import subprocess
+import sys
+import unittest
+
+# generous limit of import time of solid_i18n modules themselves
+# (without django), microseconds
+SELF_TIME_LIMIT = 50000
+
+
+def import_times(statement):
+    """
+    Run statement in clean interpreter without django settings,
+    return {module: (self time, cumulative time)} from -X importtime output.
+    """
+    env = dict(os.environ)
+    env.pop('DJANGO_SETTINGS_MODULE', None)
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        env=env, stderr=subprocess.PIPE, universal_newlines=True)
+    if process.returncode:
+        raise AssertionError(process.stderr)
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, cumulative, module = line[len('import time:'):].split('|')
+        times[module.strip()] = (int(self_time), int(cumulative))
+    return times
+
+
+class ImportTestCase(unittest.TestCase):
+
+    def test_package_import_is_light(self):
+        times = import_times('import solid_i18n')
+        self.assertIn('solid_i18n', times)
+        self.assertNotIn('django', times)
+
+    def test_modules_import_without_settings(self):
+        times = import_times(
+            'import solid_i18n.middleware, solid_i18n.urlresolvers, '
+            'solid_i18n.urls, solid_i18n.alternates, solid_i18n.sitemaps, '
+            'solid_i18n.context_processors, solid_i18n.templatetags.solid_i18n')
+        self_time = sum(
+            self_time for module, (self_time, cumulative) in times.items()
+            if module.startswith('solid_i18n'))
+        self.assertLess(self_time, SELF_TIME_LIMIT)
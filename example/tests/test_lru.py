@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+from unittest import TestCase
+
+from solid_i18n.lru import LRUCache
+
+
+class LRUCacheTestCase(TestCase):
+
+    def test_eviction(self):
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(len(cache), 2)
+
+    def test_info(self):
+        cache = LRUCache(maxsize=10)
+        cache.get('a')
+        cache.set('a', 1)
+        cache.get('a')
+        self.assertEqual(tuple(cache.info()), (1, 1, 10, 1))
+        cache.clear()
+        self.assertEqual(tuple(cache.info()), (0, 0, 10, 0))
+
+    def test_resize(self):
+        cache = LRUCache(maxsize=3)
+        for key in 'abc':
+            cache.set(key, key)
+        cache.resize(1)
+        self.assertEqual(len(cache), 1)
+        self.assertIn('c', cache)
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import random
+
+from django.conf import settings
+from django.test.utils import override_settings
+from django.urls import reverse
+from django.utils import translation
+
+from solid_i18n.memory import (
+    get_language_from_path, reset_language_from_path, set_language_from_path)
+from solid_i18n.urls import is_language_prefix_patterns_used
+
+from .base import URLTestCaseBase
+
+
+class MemoryTestCase(URLTestCaseBase):
+    # (active language, language from path, expected url)
+    REQUESTS = (
+        ('en', None, '/about/'),
+        ('en', 'en', '/about/'),
+        ('ru', 'ru', '/ru/about/'),
+        ('ru', None, '/ru/about/'),
+        ('pt-br', 'pt-br', '/pt-br/about/'),
+        ('my', 'my', '/my/about/'),
+    )
+
+    def test_reset(self):
+        token = set_language_from_path('ru')
+        self.assertEqual(get_language_from_path(), 'ru')
+        reset_language_from_path(token)
+        self.assertIsNone(get_language_from_path())
+
+    def test_concurrent_coroutines(self):
+        self.assertTrue(all(asyncio.run(self.run_requests(self.REQUESTS))))
+        self.assertIsNone(get_language_from_path())
+
+    @override_settings(SOLID_I18N_HANDLE_DEFAULT_PREFIX=True)
+    def test_concurrent_coroutines_default_prefix(self):
+        is_language_prefix_patterns_used(settings.ROOT_URLCONF)
+        requests = self.REQUESTS[:1] + (('en', 'en', '/en/about/'),)
+        requests += self.REQUESTS[2:]
+        self.assertTrue(all(asyncio.run(self.run_requests(requests))))
+
+    async def run_requests(self, choices):
+        async def request(language, language_from_path, expected_url):
+            token = set_language_from_path(language_from_path)
+            try:
+                await asyncio.sleep(0)
+                with translation.override(language):
+                    await asyncio.sleep(random.random() / 1000)
+                    self.assertEqual(
+                        get_language_from_path(), language_from_path)
+                    url = reverse('about')
+                    await asyncio.sleep(0)
+                    self.assertEqual(
+                        get_language_from_path(), language_from_path)
+                    return url == expected_url
+            finally:
+                reset_language_from_path(token)
+
+        requests = [random.choice(choices) for i in range(500)]
+        return await asyncio.gather(*(request(*r) for r in requests))
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+from django.http import HttpResponse, HttpResponseNotFound
+from django.test import RequestFactory
+from django.test.utils import override_settings
+
+from solid_i18n.metrics import Histogram, Metrics, metrics
+from solid_i18n.middleware import SolidLocaleMiddleware
+
+from .base import URLTestCaseBase
+
+
+class MetricsTestCase(URLTestCaseBase):
+
+    def test_counters_and_histograms(self):
+        m = Metrics()
+        m.increment('requests')
+        m.increment('requests', 2)
+        m.observe('middleware_seconds', 0.0003)
+        snapshot = m.snapshot()
+        self.assertEqual(snapshot['counters'], {'requests': 3})
+        histogram = snapshot['histograms']['middleware_seconds']
+        self.assertEqual(histogram['count'], 1)
+        self.assertEqual(
+            dict(histogram['buckets'])[str(0.0005)], 1)
+        m.reset()
+        self.assertEqual(m.snapshot(), {'counters': {}, 'histograms': {}})
+
+    def test_histogram_overflow_bucket(self):
+        histogram = Histogram(buckets=(1, float('inf')))
+        histogram.observe(5)
+        self.assertEqual(histogram.counts, [0, 1])
+
+    def test_hooks(self):
+        m = Metrics()
+        calls = []
+        hook = lambda *args: calls.append(args)
+        m.add_hook(hook)
+        m.increment('requests')
+        m.observe('middleware_seconds', 0.1)
+        m.remove_hook(hook)
+        m.increment('requests')
+        self.assertEqual(calls, [
+            ('counter', 'requests', 1),
+            ('histogram', 'middleware_seconds', 0.1),
+        ])
+
+
+class MiddlewareMetricsTestCase(URLTestCaseBase):
+
+    def setUp(self):
+        super(MiddlewareMetricsTestCase, self).setUp()
+        metrics.reset()
+
+    def tearDown(self):
+        metrics.reset()
+        super(MiddlewareMetricsTestCase, self).tearDown()
+
+    def process(self, path, response=None, **extra):
+        middleware = SolidLocaleMiddleware(lambda request: HttpResponse())
+        request = RequestFactory().get(path, **extra)
+        response = middleware.process_request(request) or response
+        return middleware.process_response(
+            request, response or HttpResponse())
+
+    def test_disabled_by_default(self):
+        middleware = SolidLocaleMiddleware(lambda request: HttpResponse())
+        self.assertIsNone(middleware.metrics)
+        self.process('/ru/about/')
+        self.assertEqual(metrics.snapshot()['counters'], {})
+
+    @override_settings(SOLID_I18N_METRICS=True, SOLID_I18N_USE_REDIRECTS=True)
+    def test_language_sources(self):
+        self.process('/ru/about/')
+        self.process('/about/', HTTP_COOKIE='django_language=ru')
+        self.process('/about/', HTTP_ACCEPT_LANGUAGE='ru')
+        self.process('/about/', HTTP_ACCEPT_LANGUAGE='de')
+        counters = metrics.snapshot()['counters']
+        self.assertEqual(counters['requests'], 4)
+        self.assertEqual(counters['language_source.path'], 1)
+        self.assertEqual(counters['language_source.cookie'], 1)
+        self.assertEqual(counters['language_source.header'], 1)
+        self.assertEqual(counters['language_source.default'], 1)
+        histogram = metrics.snapshot()['histograms']['middleware_seconds']
+        self.assertEqual(histogram['count'], 4)
+
+    @override_settings(SOLID_I18N_METRICS=True, SOLID_I18N_USE_REDIRECTS=True)
+    def test_redirects(self):
+        response = self.process(
+            '/about/', HttpResponseNotFound(), HTTP_ACCEPT_LANGUAGE='ru')
+        self.assertEqual(response.status_code, 302)
+        counters = metrics.snapshot()['counters']
+        self.assertEqual(counters['redirects.language'], 1)
+        self.assertEqual(counters['perform_redirect'], 1)
+
+    @override_settings(SOLID_I18N_METRICS=True,
+                       SOLID_I18N_DEFAULT_PREFIX_REDIRECT=True)
+    def test_default_prefix_redirect(self):
+        response = self.process('/en/about/')
+        self.assertEqual(response.status_code, 301)
+        counters = metrics.snapshot()['counters']
+        self.assertEqual(counters['redirects.default_prefix'], 1)
+        self.assertEqual(counters['language_source.path'], 1)
@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+from unittest import mock
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import override_settings
+from django.urls import clear_url_caches, is_valid_path
+from django.utils import translation
+
+from solid_i18n.middleware import (
+    PATH_INVALID, PATH_NEEDS_SLASH, SolidLocaleMiddleware,
+    accept_language_cache, valid_path_cache)
+
+from .base import URLTestCaseBase
+
+
+class MiddlewareConfigTestCase(URLTestCaseBase):
+
+    def get_middleware(self):
+        return SolidLocaleMiddleware(lambda request: HttpResponse())
+
+    def test_config_snapshot(self):
+        middleware = self.get_middleware()
+        self.assertEqual(middleware.default_lang, 'en')
+        self.assertFalse(middleware.use_redirects)
+        self.assertEqual(
+            middleware.config.languages, frozenset(['ru', 'en', 'my', 'pt-br']))
+        with self.assertRaises(AttributeError):
+            middleware.config.use_redirects = True
+
+    def test_config_follows_settings_change(self):
+        middleware = self.get_middleware()
+        with override_settings(SOLID_I18N_USE_REDIRECTS=True,
+                               LANGUAGE_CODE='ru'):
+            self.assertTrue(middleware.use_redirects)
+            self.assertEqual(middleware.default_lang, 'ru')
+        self.assertFalse(middleware.use_redirects)
+        self.assertEqual(middleware.default_lang, 'en')
+
+
+class PathResolutionTestCase(URLTestCaseBase):
+
+    def get_middleware(self):
+        return SolidLocaleMiddleware(lambda request: HttpResponse())
+
+    def test_resolution_stored_in_request(self):
+        middleware = self.get_middleware()
+        request = RequestFactory().get('/ru/about/')
+        middleware.process_request(request)
+        resolution = request.solid_i18n_resolution
+        self.assertEqual(resolution.language_from_path, 'ru')
+        self.assertTrue(resolution.prefix_patterns_used)
+        self.assertEqual(resolution.urlconf, 'example.urls')
+        with self.assertRaises(AttributeError):
+            resolution.extra = True
+        response = middleware.process_response(request, HttpResponse())
+        self.assertIs(request.solid_i18n_resolution, resolution)
+        self.assertEqual(response['Content-Language'], 'ru')
+
+    def test_response_without_request_processing(self):
+        middleware = self.get_middleware()
+        request = RequestFactory().get('/ru/about/')
+        middleware.process_response(request, HttpResponse())
+        self.assertEqual(
+            request.solid_i18n_resolution.language_from_path, 'ru')
+
+
+@override_settings(SOLID_I18N_DEFAULT_PREFIX_REDIRECT=True)
+class DefaultPrefixRedirectTestCase(URLTestCaseBase):
+
+    def test_view_is_not_executed(self):
+        views = []
+
+        def get_response(request):
+            views.append(request.path)
+            return HttpResponse()
+
+        middleware = SolidLocaleMiddleware(get_response)
+        response = middleware(RequestFactory().get('/en/about/?page=2'))
+        self.assertEqual(response.status_code, 301)
+        self.assertEqual(response['Location'], '/about/?page=2')
+        self.assertEqual(views, [])
+        self.assertEqual(translation.get_language(), 'en')
+
+    def test_invalid_path_is_not_redirected(self):
+        views = []
+
+        def get_response(request):
+            views.append(request.path)
+            return HttpResponse(status=404)
+
+        middleware = SolidLocaleMiddleware(get_response)
+        response = middleware(RequestFactory().get('/en/missing/'))
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(views, ['/en/missing/'])
+
+
+@override_settings(SOLID_I18N_USE_REDIRECTS=True,
+                   SOLID_I18N_EAGER_REDIRECTS=True)
+class EagerRedirectTestCase(URLTestCaseBase):
+
+    def get_middleware(self, views):
+        def get_response(request):
+            views.append(request.path)
+            return HttpResponse(status=404)
+        return SolidLocaleMiddleware(get_response)
+
+    def test_redirect_before_view(self):
+        views = []
+        middleware = self.get_middleware(views)
+        for i in range(2):
+            response = middleware(RequestFactory().get(
+                '/about/', HTTP_ACCEPT_LANGUAGE='ru'))
+            self.assertEqual(response.status_code, 302)
+            self.assertEqual(response['Location'], '/ru/about/')
+            self.assertIn('Accept-Language', response['Vary'])
+        self.assertEqual(views, [])
+
+    @override_settings(SOLID_I18N_VARY_HEADER='X-Language')
+    def test_vary_header_fallback(self):
+        response = self.get_middleware([])(RequestFactory().get(
+            '/about/', HTTP_ACCEPT_LANGUAGE='ru'))
+        self.assertEqual(response['Location'], '/ru/about/')
+        self.assertEqual(response['Vary'], 'X-Language, Accept-Language')
+        response = self.get_middleware([])(RequestFactory().get(
+            '/about/', HTTP_X_LANGUAGE='ru', HTTP_ACCEPT_LANGUAGE='en'))
+        self.assertEqual(response['Location'], '/ru/about/')
+        self.assertEqual(response['Vary'], 'X-Language')
+
+    def test_post_not_redirected_before_view(self):
+        views = []
+        middleware = self.get_middleware(views)
+        middleware(RequestFactory().post(
+            '/about/', HTTP_ACCEPT_LANGUAGE='ru'))
+        self.assertEqual(views, ['/about/'])
+
+    def test_invalid_prefixed_path(self):
+        views = []
+        middleware = self.get_middleware(views)
+        response = middleware(RequestFactory().get(
+            '/missing/', HTTP_ACCEPT_LANGUAGE='ru'))
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(views, ['/missing/'])
+
+    def test_default_language_not_redirected(self):
+        views = []
+        middleware = self.get_middleware(views)
+        middleware(RequestFactory().get('/about/', HTTP_ACCEPT_LANGUAGE='en'))
+        self.assertEqual(views, ['/about/'])
+
+    @override_settings(SOLID_I18N_EAGER_REDIRECTS=False)
+    def test_disabled(self):
+        views = []
+        middleware = self.get_middleware(views)
+        response = middleware(RequestFactory().get(
+            '/about/', HTTP_ACCEPT_LANGUAGE='ru'))
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(views, ['/about/'])
+
+
+@override_settings(SOLID_I18N_USE_REDIRECTS=True)
+class CdnHeadersTestCase(URLTestCaseBase):
+
+    def get_response(self, path, status=200, **extra):
+        middleware = SolidLocaleMiddleware(
+            lambda request: HttpResponse(status=status))
+        return middleware(RequestFactory().get(path, **extra))
+
+    def test_defaults(self):
+        response = self.get_response('/about/', HTTP_ACCEPT_LANGUAGE='ru')
+        self.assertEqual(response['Vary'], 'Accept-Language')
+        self.assertNotIn('Cache-Control', response)
+
+    @override_settings(SOLID_I18N_VARY_HEADER='X-Language')
+    def test_vary_header(self):
+        response = self.get_response(
+            '/about/', 404, HTTP_X_LANGUAGE='ru', HTTP_ACCEPT_LANGUAGE='en')
+        self.assertEqual(response['Location'], '/ru/about/')
+        self.assertEqual(response['Vary'], 'X-Language')
+        # Accept-Language is used, if header is not set
+        response = self.get_response(
+            '/about/', 404, HTTP_ACCEPT_LANGUAGE='ru')
+        self.assertEqual(response['Location'], '/ru/about/')
+        self.assertEqual(response['Vary'], 'X-Language, Accept-Language')
+        response = self.get_response(
+            '/about/', 404, HTTP_X_LANGUAGE='de', HTTP_ACCEPT_LANGUAGE='ru')
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(SOLID_I18N_LANGUAGE_HEADER='Surrogate-Key')
+    def test_language_header(self):
+        response = self.get_response('/ru/about/')
+        self.assertEqual(response['Surrogate-Key'], 'ru')
+        middleware = SolidLocaleMiddleware(lambda request: HttpResponse(
+            headers={'Surrogate-Key': 'about'}))
+        response = middleware(RequestFactory().get('/about/'))
+        self.assertEqual(response['Surrogate-Key'], 'about en')
+
+    @override_settings(
+        SOLID_I18N_REDIRECT_CACHE_CONTROL={'public': True, 'max_age': 600},
+        SOLID_I18N_EAGER_REDIRECTS=True)
+    def test_redirect_cache_control(self):
+        response = self.get_response('/about/', HTTP_ACCEPT_LANGUAGE='ru')
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response['Cache-Control'], 'public, max-age=600')
+        response = self.get_response('/ru/about/')
+        self.assertNotIn('Cache-Control', response)
+
+
+@override_settings(SOLID_I18N_EXCLUDE_PREFIXES=['/static/', '/healthz'],
+                   SOLID_I18N_USE_REDIRECTS=True)
+class ExcludePrefixesTestCase(URLTestCaseBase):
+
+    def get_middleware(self):
+        return SolidLocaleMiddleware(lambda request: HttpResponse(status=404))
+
+    def test_excluded(self):
+        middleware = self.get_middleware()
+        self.assertEqual(
+            middleware.config.exclude_prefixes, ('/static/', '/healthz'))
+        for path in ('/static/css/site.css', '/healthz', '/healthz/ready'):
+            request = RequestFactory().get(path, HTTP_ACCEPT_LANGUAGE='ru')
+            with mock.patch('solid_i18n.middleware.trans.activate') as activate:
+                response = middleware(request)
+            self.assertFalse(activate.called)
+            self.assertEqual(response.status_code, 404)
+            self.assertFalse(hasattr(request, 'LANGUAGE_CODE'))
+            self.assertFalse(hasattr(request, 'solid_i18n_resolution'))
+            self.assertNotIn('Content-Language', response)
+            self.assertNotIn('Vary', response)
+
+    @override_settings(SOLID_I18N_EXCLUDE_PREFIXES='/static/')
+    def test_single_prefix(self):
+        middleware = self.get_middleware()
+        self.assertEqual(middleware.config.exclude_prefixes, ('/static/',))
+        response = middleware(RequestFactory().get('/ru/about/'))
+        self.assertEqual(response['Content-Language'], 'ru')
+
+    def test_empty_prefix(self):
+        with self.assertRaises(ImproperlyConfigured):
+            with override_settings(
+                    SOLID_I18N_EXCLUDE_PREFIXES=['/static/', '']):
+                self.get_middleware()
+
+    def test_language_not_kept_from_previous_request(self):
+        languages = []
+
+        def get_response(request):
+            languages.append(translation.get_language())
+            return HttpResponse()
+        middleware = SolidLocaleMiddleware(get_response)
+        middleware(RequestFactory().get('/ru/about/'))
+        middleware(RequestFactory().get('/healthz'))
+        self.assertEqual(languages, ['ru', settings.LANGUAGE_CODE])
+
+    def test_not_excluded(self):
+        request = RequestFactory().get('/about/', HTTP_ACCEPT_LANGUAGE='ru')
+        response = self.get_middleware()(request)
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(request.LANGUAGE_CODE, 'ru')
+
+
+@override_settings(SOLID_I18N_USE_REDIRECTS=True)
+class AcceptLanguageCacheTestCase(URLTestCaseBase):
+
+    def setUp(self):
+        super(AcceptLanguageCacheTestCase, self).setUp()
+        accept_language_cache.clear()
+
+    def get_language(self, middleware, accept_language):
+        request = RequestFactory().get(
+            '/about/', HTTP_ACCEPT_LANGUAGE=accept_language)
+        middleware.process_request(request)
+        return request.LANGUAGE_CODE
+
+    def test_negotiation_is_cached(self):
+        middleware = SolidLocaleMiddleware(lambda request: HttpResponse())
+        self.assertEqual(self.get_language(middleware, 'ru-RU,ru;q=0.8'), 'ru')
+        self.assertEqual(self.get_language(middleware, 'ru-RU,ru;q=0.8'), 'ru')
+        self.assertEqual(self.get_language(middleware, 'de,en;q=0.5'), 'en')
+        info = accept_language_cache.info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 2))
+
+    def test_cookie_has_priority(self):
+        middleware = SolidLocaleMiddleware(lambda request: HttpResponse())
+        request = RequestFactory().get(
+            '/about/', HTTP_ACCEPT_LANGUAGE='ru-RU,ru;q=0.8')
+        request.COOKIES[settings.LANGUAGE_COOKIE_NAME] = 'en'
+        middleware.process_request(request)
+        self.assertEqual(request.LANGUAGE_CODE, 'en')
+
+    def test_invalidated_by_languages_change(self):
+        middleware = SolidLocaleMiddleware(lambda request: HttpResponse())
+        self.assertEqual(self.get_language(middleware, 'ru-RU,ru;q=0.8'), 'ru')
+        with override_settings(LANGUAGES=(('en', 'English'),)):
+            self.assertEqual(len(accept_language_cache), 0)
+            self.assertEqual(
+                self.get_language(middleware, 'ru-RU,ru;q=0.8'), 'en')
+
+    @override_settings(SOLID_I18N_ACCEPT_LANGUAGE_CACHE_SIZE=1)
+    def test_cache_size(self):
+        middleware = SolidLocaleMiddleware(lambda request: HttpResponse())
+        self.get_language(middleware, 'ru')
+        self.get_language(middleware, 'en')
+        self.assertEqual(accept_language_cache.info().maxsize, 1)
+        self.assertEqual(len(accept_language_cache), 1)
+
+
+class ValidPathCacheTestCase(URLTestCaseBase):
+
+    def setUp(self):
+        super(ValidPathCacheTestCase, self).setUp()
+        valid_path_cache.clear()
+
+    def perform_redirect(self, path, language):
+        middleware = SolidLocaleMiddleware(lambda request: HttpResponse())
+        request = RequestFactory().get(path)
+        with translation.override(language or 'en'):
+            return middleware.perform_redirect(request, language)
+
+    def test_results_are_cached(self):
+        with mock.patch('solid_i18n.middleware.is_valid_path',
+                        wraps=is_valid_path) as is_valid_path_mock:
+            for i in range(3):
+                self.assertIsNone(self.perform_redirect('/missing', 'ru'))
+            self.assertEqual(is_valid_path_mock.call_count, 2)
+            for i in range(3):
+                response = self.perform_redirect('/about', 'ru')
+                self.assertEqual(response['Location'], '/ru/about/')
+            self.assertEqual(is_valid_path_mock.call_count, 4)
+        self.assertEqual(
+            valid_path_cache.get(('example.urls', 'ru', '/ru/about'))[1],
+            PATH_NEEDS_SLASH)
+        self.assertEqual(
+            valid_path_cache.get(('example.urls', 'ru', '/ru/missing'))[1],
+            PATH_INVALID)
+
+    def test_invalidated_by_clear_url_caches(self):
+        with mock.patch('solid_i18n.middleware.is_valid_path',
+                        wraps=is_valid_path) as is_valid_path_mock:
+            self.perform_redirect('/ru/about/', '')
+            clear_url_caches()
+            self.perform_redirect('/ru/about/', '')
+            self.assertEqual(is_valid_path_mock.call_count, 2)
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+from unittest import mock
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import override_settings
+from django.urls import clear_url_caches
+
+from solid_i18n import routing
+from solid_i18n.middleware import SolidLocaleMiddleware
+from solid_i18n.conf import get_config
+from solid_i18n.routing import get_routing_table, routing_tables
+
+from .base import URLTestCaseBase
+
+
+class RoutingTableTestCase(URLTestCaseBase):
+
+    def setUp(self):
+        super(RoutingTableTestCase, self).setUp()
+        routing_tables.clear()
+
+    def test_table(self):
+        table = get_routing_table('example.urls')
+        self.assertTrue(table.prefix_patterns_used)
+        self.assertIs(table.config, get_config())
+
+        table = get_routing_table('tests.urls_noni18n')
+        self.assertFalse(table.prefix_patterns_used)
+
+    def test_compiled_once(self):
+        with mock.patch('solid_i18n.routing.compile_routing_table',
+                        wraps=routing.compile_routing_table) as compile_mock:
+            for i in range(3):
+                get_routing_table('example.urls')
+                get_routing_table('tests.urls_noni18n')
+            self.assertEqual(compile_mock.call_count, 2)
+            clear_url_caches()
+            get_routing_table('example.urls')
+            self.assertEqual(compile_mock.call_count, 3)
+
+    def test_follows_settings_change(self):
+        table = get_routing_table('example.urls')
+        with override_settings(LANGUAGE_CODE='ru'):
+            self.assertIsNot(get_routing_table('example.urls'), table)
+            prefixes = dict(
+                get_routing_table('example.urls').config.language_prefixes)
+            self.assertEqual(prefixes['ru'], '')
+            self.assertEqual(prefixes['en'], 'en/')
+
+    @override_settings(SOLID_I18N_PREFIX_PATTERNS_CACHE_SIZE=1)
+    def test_lru_eviction(self):
+        # size is taken from settings without middleware
+        get_routing_table('example.urls')
+        get_routing_table('tests.urls_noni18n')
+        self.assertEqual(routing_tables.info().maxsize, 1)
+        self.assertEqual(len(routing_tables), 1)
+        self.assertIn('tests.urls_noni18n', routing_tables)
+
+    def test_middleware_uses_request_urlconf(self):
+        middleware = SolidLocaleMiddleware(lambda request: HttpResponse())
+        request = RequestFactory().get('/onelang/')
+        request.urlconf = 'tests.urls_noni18n'
+        middleware.process_request(request)
+        resolution = request.solid_i18n_resolution
+        self.assertIs(resolution.routing, routing_tables.get(request.urlconf))
+        self.assertFalse(resolution.prefix_patterns_used)
+        middleware.process_response(request, HttpResponse())
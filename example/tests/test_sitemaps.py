@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+from django.test.utils import override_settings
+
+from example.sitemaps import PagesSitemap
+
+from .base import URLTestCaseBase
+
+
+class SitemapTestCase(URLTestCaseBase):
+
+    def get_urls(self, sitemap, page=1):
+        class Site(object):
+            domain = 'example.com'
+        return sitemap.get_urls(page=page, site=Site(), protocol='http')
+
+    def test_urls(self):
+        urls = list(self.get_urls(PagesSitemap()))
+        self.assertEqual(
+            [url['location'] for url in urls[:4]], [
+                'http://example.com/ru/',
+                'http://example.com/',
+                'http://example.com/my/',
+                'http://example.com/pt-br/',
+            ])
+        self.assertEqual(len(urls), 8)
+        about = urls[5]
+        self.assertEqual(about['item'], ('about', 'en'))
+        self.assertEqual(about['location'], 'http://example.com/about/')
+        self.assertEqual(about['alternates'], [
+            {'location': 'http://example.com/ru/about/', 'lang_code': 'ru'},
+            {'location': 'http://example.com/about/', 'lang_code': 'en'},
+            {'location': 'http://example.com/my/about/', 'lang_code': 'my'},
+            {'location': 'http://example.com/pt-br/about/',
+             'lang_code': 'pt-br'},
+            {'location': 'http://example.com/about/',
+             'lang_code': 'x-default'},
+        ])
+
+    def test_pagination(self):
+        sitemap = PagesSitemap()
+        sitemap.limit = 4
+        self.assertEqual(sitemap.paginator.num_pages, 2)
+        urls = list(self.get_urls(sitemap, page=2))
+        self.assertEqual(len(urls), 4)
+        self.assertEqual(set(url['item'][0] for url in urls), set(['about']))
+
+    @override_settings(SOLID_I18N_HANDLE_DEFAULT_PREFIX=True)
+    def test_sitemap_view(self):
+        response = self.client.get('/en/sitemap.xml')
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get('/sitemap.xml')
+        content = response.content.decode('utf8')
+        self.assertIn('<loc>http://example.com/about/</loc>', content)
+        self.assertIn('<loc>http://example.com/pt-br/about/</loc>', content)
+        self.assertIn(
+            '<xhtml:link rel="alternate" hreflang="x-default" '
+            'href="http://example.com/about/"/>', content)
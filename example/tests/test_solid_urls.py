@@ -1,12 +1,20 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-from django.urls import reverse
+from unittest import mock
+
+from django.urls import (
+    clear_url_caches, get_resolver, reverse, set_script_prefix)
 from django.urls import include, re_path as url
 from django.utils import translation
 from django.test.utils import override_settings
 from django.views.generic import TemplateView
-from solid_i18n.urls import solid_i18n_patterns
+from solid_i18n.conf import get_config
+from solid_i18n.memory import reset_language_from_path, set_language_from_path
+from solid_i18n.middleware import get_path_validity, valid_path_cache
+from solid_i18n.urls import (
+    is_language_prefix_patterns_used, prefix_patterns_cache,
+    reverse_all_languages, solid_i18n_patterns)
 
 from .base import URLTestCaseBase
 
@@ -321,3 +329,96 @@ class TranslationAccessTestCase(URLTestCaseBase):
         self.assertTrue("/about/" in response["Location"])
         self.assertFalse("/en/about/" in response["Location"])
         self.assertFalse("/ru/about/" in response["Location"])
+
+
+class ReverseAllLanguagesTestCase(URLTestCaseBase):
+    ABOUT_URLS = {
+        "ru": "/ru/about/",
+        "en": "/about/",
+        "my": "/my/about/",
+        "pt-br": "/pt-br/about/",
+    }
+
+    def test_solid_url(self):
+        with mock.patch("solid_i18n.urls.reverse", wraps=reverse) as reverse_mock:
+            self.assertEqual(reverse_all_languages("about"), self.ABOUT_URLS)
+            self.assertEqual(reverse_mock.call_count, 2)
+        self.assertEqual(list(reverse_all_languages("about")), ["ru", "en", "my", "pt-br"])
+
+    def test_noni18n_url(self):
+        urls = reverse_all_languages("onelang")
+        self.assertEqual(set(urls.values()), set(["/onelang/"]))
+        self.assertEqual(len(urls), 4)
+
+    def test_script_prefix(self):
+        set_script_prefix("/site/")
+        try:
+            urls = reverse_all_languages("about")
+        finally:
+            set_script_prefix("/")
+        self.assertEqual(urls["en"], "/site/about/")
+        self.assertEqual(urls["ru"], "/site/ru/about/")
+
+    @override_settings(SOLID_I18N_HANDLE_DEFAULT_PREFIX=True)
+    def test_default_prefix_in_path(self):
+        token = set_language_from_path("en")
+        try:
+            with translation.override("en"):
+                self.assertEqual(reverse_all_languages("about"), self.ABOUT_URLS)
+                self.assertEqual(reverse("about"), "/en/about/")
+        finally:
+            reset_language_from_path(token)
+
+    @override_settings(LANGUAGES=(("en", "English"),))
+    def test_one_language(self):
+        self.assertEqual(reverse_all_languages("about"), {"en": "/about/"})
+
+
+class PrefixPatternsCacheTestCase(URLTestCaseBase):
+
+    def setUp(self):
+        super(PrefixPatternsCacheTestCase, self).setUp()
+        is_language_prefix_patterns_used.cache_clear()
+
+    def test_cached(self):
+        for i in range(3):
+            self.assertTrue(is_language_prefix_patterns_used('example.urls'))
+            self.assertFalse(
+                is_language_prefix_patterns_used('tests.urls_noni18n'))
+        info = is_language_prefix_patterns_used.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (4, 2, 2))
+
+    def test_invalidated_by_clear_url_caches(self):
+        self.assertTrue(is_language_prefix_patterns_used('example.urls'))
+        resolver = prefix_patterns_cache.get('example.urls')[0]
+        clear_url_caches()
+        self.assertTrue(is_language_prefix_patterns_used('example.urls'))
+        self.assertIsNot(prefix_patterns_cache.get('example.urls')[0], resolver)
+        self.assertIs(
+            prefix_patterns_cache.get('example.urls')[0],
+            get_resolver('example.urls'))
+
+    def test_cache_clear(self):
+        is_language_prefix_patterns_used('example.urls')
+        get_path_validity('/ru/about/', 'example.urls', 'ru', get_config())
+        self.assertEqual(len(valid_path_cache), 1)
+        is_language_prefix_patterns_used.cache_clear()
+        self.assertEqual(len(prefix_patterns_cache), 0)
+        self.assertEqual(len(valid_path_cache), 0)
+
+    @override_settings(SOLID_I18N_PREFIX_PATTERNS_CACHE_SIZE=1)
+    def test_bounded(self):
+        is_language_prefix_patterns_used('example.urls')
+        is_language_prefix_patterns_used('tests.urls_noni18n')
+        self.assertEqual(len(prefix_patterns_cache), 1)
+        self.assertNotIn('example.urls', prefix_patterns_cache)
+
+    @override_settings(SOLID_I18N_PREFIX_PATTERNS_CACHE_SIZE=10)
+    def test_size_setting(self):
+        # without middleware
+        is_language_prefix_patterns_used('example.urls')
+        self.assertEqual(
+            is_language_prefix_patterns_used.cache_info().maxsize, 10)
+        self.client.get('/about/')
+        self.assertEqual(
+            is_language_prefix_patterns_used.cache_info().maxsize, 10)
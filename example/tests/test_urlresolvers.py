@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+import random
+import threading
+
+from django.conf import settings
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import clear_url_caches, get_resolver, reverse
+from django.utils import translation
+
+from solid_i18n.memory import reset_language_from_path, set_language_from_path
+from solid_i18n.urlresolvers import DEFAULT_PREFIXED, SolidLocalePrefixPattern
+from solid_i18n.urls import is_language_prefix_patterns_used
+
+from .base import URLTestCaseBase
+
+
+class PrefixPatternMatchTestCase(URLTestCaseBase):
+
+    def get_pattern(self):
+        return SolidLocalePrefixPattern(prefix_default_language=False)
+
+    def test_match(self):
+        pattern = self.get_pattern()
+        with translation.override('en'):
+            self.assertEqual(pattern.match('about/'), ('about/', (), {}))
+            self.assertEqual(pattern.match('en/about/'), ('about/', (), {}))
+            self.assertIsNone(pattern.match('en/'))
+        with translation.override('ru'):
+            self.assertEqual(pattern.match('ru/about/'), ('about/', (), {}))
+            self.assertEqual(pattern.match('about/'), ('about/', (), {}))
+
+    def test_match_unknown_language(self):
+        pattern = self.get_pattern()
+        with translation.override('de'):
+            self.assertEqual(pattern.match('de/about/'), ('about/', (), {}))
+
+    def test_match_follows_settings_change(self):
+        pattern = self.get_pattern()
+        with override_settings(SOLID_I18N_HANDLE_DEFAULT_PREFIX=True):
+            with translation.override('en'):
+                self.assertEqual(pattern.match('en/'), ('', (), {}))
+        with override_settings(SOLID_I18N_USE_REDIRECTS=True):
+            with translation.override('ru'):
+                self.assertIsNone(pattern.match('about/'))
+        with override_settings(LANGUAGE_CODE='ru'):
+            with translation.override('ru'):
+                self.assertIsNone(pattern.match('ru/'))
+        with translation.override('en'):
+            self.assertIsNone(pattern.match('en/'))
+
+
+@override_settings(SOLID_I18N_HANDLE_DEFAULT_PREFIX=True)
+class DefaultPrefixReverseTestCase(URLTestCaseBase):
+
+    def reverse(self, language_from_path):
+        token = set_language_from_path(language_from_path)
+        try:
+            return reverse('about')
+        finally:
+            reset_language_from_path(token)
+
+    def test_reverse_without_middleware(self):
+        with translation.override('en'):
+            self.assertEqual(self.reverse('en'), '/en/about/')
+            self.assertEqual(self.reverse(None), '/about/')
+            self.assertEqual(self.reverse('en'), '/en/about/')
+        clear_url_caches()
+        with translation.override('en'):
+            self.assertEqual(self.reverse('en'), '/en/about/')
+            self.assertEqual(self.reverse(None), '/about/')
+
+    def test_separate_reverse_data(self):
+        resolver = get_resolver()
+        self.assertTrue(is_language_prefix_patterns_used(settings.ROOT_URLCONF))
+        pattern = resolver.url_patterns[0].pattern
+        with translation.override('en'):
+            for i in range(3):
+                self.assertEqual(self.reverse('en'), '/en/about/')
+                prefixed_regex = pattern.regex
+                self.assertEqual(self.reverse(None), '/about/')
+                regex = pattern.regex
+            self.assertIs(self.reverse('en') and pattern.regex, prefixed_regex)
+            self.assertIs(self.reverse(None) and pattern.regex, regex)
+        self.assertEqual(
+            set(resolver._reverse_dict), set(['en', ('en', DEFAULT_PREFIXED)]))
+
+
+@override_settings(SOLID_I18N_HANDLE_DEFAULT_PREFIX=True)
+class ThreadedTrafficTestCase(URLTestCaseBase):
+    THREADS = 32
+    REQUESTS_PER_THREAD = 30
+    # path => reversed url in response
+    PATHS = {
+        '/about/': '/about/',
+        '/en/about/': '/en/about/',
+        '/ru/about/': '/ru/about/',
+        '/pt-br/about/': '/pt-br/about/',
+    }
+
+    def test_mixed_traffic(self):
+        barrier = threading.Barrier(self.THREADS)
+        errors = []
+
+        def worker(seed):
+            client = Client()
+            paths = random.Random(seed).choices(
+                list(self.PATHS), k=self.REQUESTS_PER_THREAD)
+            barrier.wait()
+            for path in paths:
+                content = client.get(path).content.decode('utf8')
+                expected = '<test>%s</test>' % self.PATHS[path]
+                if expected not in content:
+                    errors.append((path, content))
+
+        threads = [threading.Thread(target=worker, args=(i,))
+                   for i in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+from io import StringIO
+
+from django.core.management import call_command
+from django.test.utils import override_settings
+from django.urls import get_resolver
+from django.utils.translation import trans_real
+
+from solid_i18n.memory import reset_language_from_path, set_language_from_path
+from solid_i18n.routing import routing_tables
+from solid_i18n.urlresolvers import DEFAULT_PREFIXED
+from solid_i18n.warmup import warmup
+
+from .base import URLTestCaseBase
+
+
+class WarmupTestCase(URLTestCaseBase):
+
+    def setUp(self):
+        super(WarmupTestCase, self).setUp()
+        routing_tables.clear()
+
+    def test_warmup(self):
+        timings = warmup()
+        self.assertEqual(list(timings), ['translations', 'routing', 'reverse'])
+        self.assertIn('example.urls', routing_tables)
+        for language in ('en', 'ru', 'my', 'pt-br'):
+            self.assertIn(language, trans_real._translations)
+        reverse_dict = get_resolver('example.urls')._reverse_dict
+        self.assertEqual(
+            set(dict.keys(reverse_dict)), {'en', 'ru', 'my', 'pt-br'})
+
+    @override_settings(SOLID_I18N_HANDLE_DEFAULT_PREFIX=True)
+    def test_default_prefixed_reverse_data(self):
+        warmup(['example.urls', 'tests.urls_noni18n'])
+        self.assertIn('tests.urls_noni18n', routing_tables)
+        reverse_dict = get_resolver('example.urls')._reverse_dict
+        self.assertIn(('en', DEFAULT_PREFIXED), dict.keys(reverse_dict))
+        token = set_language_from_path('en')
+        try:
+            self.assertIn('en', reverse_dict)
+        finally:
+            reset_language_from_path(token)
+
+    def test_command(self):
+        out = StringIO()
+        call_command('solid_i18n_warmup', '--urlconf', 'example.urls',
+                     stdout=out)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(
+            [line.split(':')[0] for line in lines],
+            ['translations', 'routing', 'reverse', 'total'])
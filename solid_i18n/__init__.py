@@ -2,13 +2,16 @@ import warnings
 __author__ = 'st4lk'
 __version__ = '1.4.2'
 
-try:
-    from django import VERSION
-except ImportError:
-    pass
-else:
-    DEPRECATED_DJANGO_VERSIONS = []
+DEPRECATED_DJANGO_VERSIONS = []
 
-    if VERSION[:2] in DEPRECATED_DJANGO_VERSIONS:
-        warnings.warn("Support of Django versions %s will be dropped soon"
-            % DEPRECATED_DJANGO_VERSIONS, PendingDeprecationWarning)
+# django is imported only when there are deprecated versions to check,
+# to keep import of this package cheap
+if DEPRECATED_DJANGO_VERSIONS:
+    try:
+        from django import VERSION
+    except ImportError:
+        pass
+    else:
+        if VERSION[:2] in DEPRECATED_DJANGO_VERSIONS:
+            warnings.warn("Support of Django versions %s will be dropped soon"
+                % DEPRECATED_DJANGO_VERSIONS, PendingDeprecationWarning)
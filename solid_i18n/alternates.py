@@ -0,0 +1,124 @@
+"""
+Urls of current page for every language, i.e. for
+<link rel="alternate" hreflang="..."> tags.
+"""
+from collections import namedtuple
+from urllib.parse import unquote, urlsplit, urlunsplit
+
+from django.core.signals import setting_changed
+from django.urls import (
+    NoReverseMatch, Resolver404, get_resolver, get_script_prefix, resolve)
+from django.utils import translation
+
+from .conf import CONFIG_SETTINGS, get_config
+from .lru import LRUCache
+from .memory import reset_language_from_path, set_language_from_path
+from .middleware import get_language_from_path
+from .urls import reverse_all_languages
+
+X_DEFAULT = 'x-default'
+
+Alternate = namedtuple('Alternate', ('language', 'url'))
+
+# (urlconf, script prefix, view name, args, kwargs) =>
+# (resolver, tuple of Alternate)
+alternates_cache = LRUCache(maxsize=1000)
+
+
+def get_alternates_for(view_name, args=(), kwargs=None, urlconf=None):
+    """
+    Returns tuple of Alternate for every language and x-default,
+    that points to default language url. Views outside of
+    solid_i18n_patterns have no alternates. Result is cached and bound
+    to resolver, so it is invalidated by clear_url_caches.
+    """
+    kwargs = kwargs or {}
+    resolver = get_resolver(urlconf)
+    try:
+        key = (urlconf, get_script_prefix(), view_name, tuple(args),
+               tuple(sorted(kwargs.items())))
+        hash(key)
+    except TypeError:
+        key = None
+    if key is not None:
+        cached = alternates_cache.get(key)
+        if cached is not None and cached[0] is resolver:
+            return cached[1]
+    config = get_config()
+    try:
+        urls = reverse_all_languages(
+            view_name, urlconf=urlconf, args=args, kwargs=kwargs)
+    except NoReverseMatch:
+        urls = {}
+    if len(set(urls.values())) > 1:
+        alternates = tuple(Alternate(language, url)
+                           for language, url in urls.items())
+        if config.default_lang in urls:
+            alternates += (Alternate(X_DEFAULT, urls[config.default_lang]),)
+    else:
+        # the same url for all languages: view is not localized
+        alternates = ()
+    if key is not None:
+        alternates_cache.set(key, (resolver, alternates))
+    return alternates
+
+
+def get_alternates(request):
+    """
+    Alternates of the page, requested by request.
+    """
+    match = getattr(request, 'resolver_match', None)
+    if match is None or not match.view_name:
+        return ()
+    return get_alternates_for(
+        match.view_name, match.args, match.kwargs,
+        getattr(request, 'urlconf', None))
+
+
+def translate_url_all(url, urlconf=None):
+    """
+    Solid-aware version of django.urls.translate_url for all languages:
+    returns {language code: url}. Url is resolved only once, query string
+    and fragment are kept. If url can't be resolved or reversed, it is
+    returned unchanged for every language.
+    Results for urls without arguments are cached.
+    """
+    config = get_config()
+    parsed = urlsplit(url)
+    path = unquote(parsed.path)
+    language_from_path = get_language_from_path(path, config)
+    token = set_language_from_path(language_from_path)
+    try:
+        with translation.override(language_from_path or config.default_lang):
+            match = resolve(path, urlconf)
+    except Resolver404:
+        match = None
+    finally:
+        reset_language_from_path(token)
+
+    urls = None
+    if match is not None and match.view_name:
+        if match.args or match.kwargs:
+            try:
+                urls = reverse_all_languages(
+                    match.view_name, urlconf, match.args, match.kwargs)
+            except NoReverseMatch:
+                pass
+        else:
+            urls = dict(
+                alternate for alternate in get_alternates_for(
+                    match.view_name, urlconf=urlconf)
+                if alternate.language != X_DEFAULT)
+    if not urls:
+        return dict((code, url) for code, prefix in config.language_prefixes)
+    return dict(
+        (code, urlunsplit(parsed[:2] + (language_url,) + parsed[3:]))
+        for code, language_url in urls.items())
+
+
+def clear_alternates_cache(setting, **kwargs):
+    if setting in CONFIG_SETTINGS:
+        alternates_cache.clear()
+
+
+setting_changed.connect(clear_alternates_cache)
@@ -0,0 +1,170 @@
+"""
+Integration with django per-site and per-view cache.
+
+Django suffixes cache keys with request.LANGUAGE_CODE, which is set by
+SolidLocaleMiddleware (language from path or negotiated language), so
+language headers in Vary only split cache by raw header values. Django
+ignores Accept-Language itself, middlewares below ignore also
+SOLID_I18N_VARY_HEADER. Vary of responses is kept for downstream caches.
+
+    MIDDLEWARE = [
+        'solid_i18n.cache.SolidUpdateCacheMiddleware',
+        ...
+        'solid_i18n.middleware.SolidLocaleMiddleware',
+        ...
+        'solid_i18n.cache.SolidFetchFromCacheMiddleware',
+    ]
+"""
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpRequest
+from django.urls import get_script_prefix
+from django.middleware.cache import (
+    CacheMiddleware, FetchFromCacheMiddleware, UpdateCacheMiddleware)
+from django.utils.cache import get_cache_key, patch_vary_headers
+from django.utils.decorators import decorator_from_middleware_with_args
+
+from .conf import get_config
+from .routing import get_routing_table
+
+
+def strip_language_vary(response, config):
+    """
+    Remove language headers from Vary of response, return removed headers.
+    They are kept in response.solid_i18n_vary, so they can be restored
+    in response, taken from cache.
+    """
+    if not config.use_i18n or not response.has_header('Vary'):
+        return ()
+    language_headers = {'accept-language', config.vary_header.lower()}
+    headers = [header.strip() for header in response['Vary'].split(',')]
+    stripped = tuple(
+        header for header in headers if header.lower() in language_headers)
+    if stripped:
+        headers = [header for header in headers if header not in stripped]
+        if headers:
+            response['Vary'] = ', '.join(headers)
+        else:
+            del response['Vary']
+        response.solid_i18n_vary = stripped
+    return stripped
+
+
+def restore_language_vary(response):
+    stripped = getattr(response, 'solid_i18n_vary', None)
+    if stripped:
+        patch_vary_headers(response, stripped)
+
+
+class SolidUpdateCacheMiddleware(UpdateCacheMiddleware):
+    """
+    UpdateCacheMiddleware, that doesn't key cached pages on raw
+    language headers.
+    """
+
+    def process_response(self, request, response):
+        strip_language_vary(response, get_config())
+        try:
+            return super(SolidUpdateCacheMiddleware, self).process_response(
+                request, response)
+        finally:
+            restore_language_vary(response)
+
+
+class SolidFetchFromCacheMiddleware(FetchFromCacheMiddleware):
+    """
+    FetchFromCacheMiddleware, that restores language headers in Vary
+    of cached response.
+    """
+
+    def process_request(self, request):
+        response = super(SolidFetchFromCacheMiddleware, self).process_request(
+            request)
+        if response is not None:
+            restore_language_vary(response)
+        return response
+
+
+class SolidCacheMiddleware(SolidUpdateCacheMiddleware,
+                           SolidFetchFromCacheMiddleware, CacheMiddleware):
+    pass
+
+
+def cache_page(timeout, *, cache=None, key_prefix=None):
+    """
+    Same as django.views.decorators.cache.cache_page, but cached pages
+    are not keyed on raw language headers.
+    """
+    return decorator_from_middleware_with_args(SolidCacheMiddleware)(
+        page_timeout=timeout, cache_alias=cache, key_prefix=key_prefix)
+
+
+class PurgeRequest(HttpRequest):
+    """
+    Request to absolute url in given language, used to find cache keys.
+    """
+
+    def __init__(self, url, language):
+        super(PurgeRequest, self).__init__()
+        parts = urlsplit(url)
+        self._scheme = parts.scheme or 'http'
+        self.path = self.path_info = parts.path or '/'
+        self.META['HTTP_HOST'] = parts.netloc
+        self.META['QUERY_STRING'] = parts.query
+        self.method = 'GET'
+        self.LANGUAGE_CODE = language
+
+    def _get_scheme(self):
+        return self._scheme
+
+
+def get_language_variants(url, urlconf=None):
+    """
+    List of (url, language) of every cached variant of absolute url:
+    url without prefix in every language and url with prefix of
+    every language. Language prefix follows script prefix.
+    """
+    table = get_routing_table(urlconf)
+    parts = urlsplit(url)
+    path = parts.path or '/'
+    script_prefix = get_script_prefix()
+    if path.startswith(script_prefix):
+        path = path[len(script_prefix) - 1:]
+    else:
+        script_prefix = '/'
+    language, unprefixed, exact = table.config.prefix_detector.detect(path)
+    if exact:
+        path = unprefixed
+    variants = []
+    for language, prefix in table.config.language_prefixes:
+        variants.append(
+            (parts._replace(path=script_prefix + path[1:]).geturl(), language))
+        if prefix or table.config.handle_default_prefix:
+            prefixed = '%s%s%s' % (script_prefix, language, path)
+            variants.append((parts._replace(path=prefixed).geturl(), language))
+    return variants
+
+
+def purge_language_variants(url, key_prefix=None, cache=None, urlconf=None):
+    """
+    Delete cached pages of absolute url (i.e. 'https://example.com/about/')
+    for every language, with and without language prefix.
+    Returns number of deleted pages.
+
+    Pages, that vary on other headers (i.e. Cookie), are deleted only
+    for requests without those headers.
+    """
+    if cache is None:
+        cache = caches[settings.CACHE_MIDDLEWARE_ALIAS]
+    elif isinstance(cache, str):
+        cache = caches[cache]
+    deleted = 0
+    for variant_url, language in get_language_variants(url, urlconf):
+        request = PurgeRequest(variant_url, language)
+        for method in ('GET', 'HEAD'):
+            cache_key = get_cache_key(request, key_prefix, method, cache=cache)
+            if cache_key is not None and cache.delete(cache_key):
+                deleted += 1
+    return deleted
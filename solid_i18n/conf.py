@@ -0,0 +1,146 @@
+"""
+Snapshot of settings, used by solid_i18n on every request.
+"""
+import re
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+
+from .detector import LanguagePrefixDetector
+
+# settings, that invalidate the snapshot, when changed
+CONFIG_SETTINGS = frozenset((
+    'LANGUAGE_CODE',
+    'LANGUAGES',
+    'USE_I18N',
+    'ROOT_URLCONF',
+    'APPEND_SLASH',
+    'SOLID_I18N_USE_REDIRECTS',
+    'SOLID_I18N_EAGER_REDIRECTS',
+    'SOLID_I18N_HANDLE_DEFAULT_PREFIX',
+    'SOLID_I18N_DEFAULT_PREFIX_REDIRECT',
+    'SOLID_I18N_PREFIX_STRICT',
+    'SOLID_I18N_ACCEPT_LANGUAGE_CACHE_SIZE',
+    'SOLID_I18N_VALID_PATH_CACHE_SIZE',
+    'SOLID_I18N_PREFIX_PATTERNS_CACHE_SIZE',
+    'SOLID_I18N_METRICS',
+    'SOLID_I18N_EXCLUDE_PREFIXES',
+    'SOLID_I18N_VARY_HEADER',
+    'SOLID_I18N_LANGUAGE_HEADER',
+    'SOLID_I18N_REDIRECT_CACHE_CONTROL',
+    'LANGUAGE_COOKIE_NAME',
+))
+
+SolidConfig = namedtuple('SolidConfig', (
+    'use_i18n',
+    'default_lang',
+    'languages',
+    'language_prefixes',
+    'use_redirects',
+    'eager_redirects',
+    'handle_default_prefix',
+    'default_prefix_redirect',
+    'prefix_strict',
+    'strict_prefix_re',
+    'prefix_detector',
+    'root_urlconf',
+    'append_slash',
+    'accept_language_cache_size',
+    'valid_path_cache_size',
+    'prefix_patterns_cache_size',
+    'metrics',
+    'exclude_prefixes',
+    'vary_header',
+    'vary_header_meta',
+    'language_header',
+    'redirect_cache_control',
+    'language_cookie_name',
+))
+
+
+def get_exclude_prefixes():
+    """
+    SOLID_I18N_EXCLUDE_PREFIXES as tuple, so path can be checked by one
+    str.startswith call. Single string is one prefix.
+    """
+    prefixes = getattr(settings, 'SOLID_I18N_EXCLUDE_PREFIXES', ())
+    if isinstance(prefixes, str):
+        prefixes = (prefixes,)
+    prefixes = tuple(prefixes)
+    if not all(prefixes):
+        # empty prefix would exclude all paths
+        raise ImproperlyConfigured(
+            'SOLID_I18N_EXCLUDE_PREFIXES must not contain empty prefix.')
+    return prefixes
+
+
+def build_config():
+    """
+    Read all settings, used by solid_i18n, into immutable SolidConfig.
+    """
+    default_lang = settings.LANGUAGE_CODE
+    language_codes = [code for code, name in settings.LANGUAGES]
+    vary_header = getattr(settings, 'SOLID_I18N_VARY_HEADER', 'Accept-Language')
+    return SolidConfig(
+        use_i18n=settings.USE_I18N,
+        default_lang=default_lang,
+        languages=frozenset(language_codes),
+        # (language code, url prefix) in settings.LANGUAGES order,
+        # default language has no prefix
+        language_prefixes=tuple(
+            (code, '' if code == default_lang else '%s/' % code)
+            for code in language_codes),
+        use_redirects=getattr(settings, 'SOLID_I18N_USE_REDIRECTS', False),
+        eager_redirects=getattr(settings, 'SOLID_I18N_EAGER_REDIRECTS', False),
+        handle_default_prefix=getattr(
+            settings, 'SOLID_I18N_HANDLE_DEFAULT_PREFIX', False),
+        default_prefix_redirect=getattr(
+            settings, 'SOLID_I18N_DEFAULT_PREFIX_REDIRECT', False),
+        prefix_strict=getattr(settings, 'SOLID_I18N_PREFIX_STRICT', False),
+        # path starts with exact language code from settings.LANGUAGES
+        strict_prefix_re=re.compile(
+            r'^/(%s)(/|$)' % '|'.join(map(re.escape, language_codes)),
+            flags=re.IGNORECASE),
+        prefix_detector=LanguagePrefixDetector(language_codes),
+        root_urlconf=settings.ROOT_URLCONF,
+        append_slash=settings.APPEND_SLASH,
+        accept_language_cache_size=getattr(
+            settings, 'SOLID_I18N_ACCEPT_LANGUAGE_CACHE_SIZE', 1000),
+        valid_path_cache_size=getattr(
+            settings, 'SOLID_I18N_VALID_PATH_CACHE_SIZE', 1000),
+        prefix_patterns_cache_size=getattr(
+            settings, 'SOLID_I18N_PREFIX_PATTERNS_CACHE_SIZE', 1000),
+        metrics=getattr(settings, 'SOLID_I18N_METRICS', False),
+        exclude_prefixes=get_exclude_prefixes(),
+        vary_header=vary_header,
+        # request.META key of vary_header
+        vary_header_meta='HTTP_%s' % vary_header.upper().replace('-', '_'),
+        language_header=getattr(settings, 'SOLID_I18N_LANGUAGE_HEADER', None),
+        redirect_cache_control=getattr(
+            settings, 'SOLID_I18N_REDIRECT_CACHE_CONTROL', None),
+        language_cookie_name=settings.LANGUAGE_COOKIE_NAME,
+    )
+
+
+_config = None
+
+
+def get_config():
+    """
+    Shared SolidConfig, built on first use and after settings change.
+    """
+    global _config
+    if _config is None:
+        _config = build_config()
+    return _config
+
+
+def reset_config(setting, **kwargs):
+    global _config
+    if setting in CONFIG_SETTINGS:
+        _config = None
+
+
+setting_changed.connect(reset_config)
@@ -0,0 +1,14 @@
+from django.utils.functional import SimpleLazyObject
+
+from .alternates import get_alternates
+
+
+def alternates(request):
+    """
+    Adds SOLID_I18N_ALTERNATES: list of (language, url) of current page
+    for every language. Urls are computed only if template uses them.
+    """
+    return {
+        'SOLID_I18N_ALTERNATES': SimpleLazyObject(
+            lambda: list(get_alternates(request))),
+    }
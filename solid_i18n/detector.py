@@ -0,0 +1,101 @@
+"""
+Detection of language prefix in path by one dict lookup of first
+path segment, instead of regex matching.
+"""
+from django.conf.locale import LANG_INFO
+from django.utils.translation import trans_real
+
+
+def is_language_segment(segment):
+    """
+    Segment has shape of language code. Shape is taken from
+    language_code_prefix_re of installed django, as it differs
+    between versions.
+    """
+    return trans_real.language_code_prefix_re.match(
+        '/%s/' % segment) is not None
+
+
+def get_variant(language_code, strict):
+    try:
+        return trans_real.get_supported_language_variant(
+            language_code, strict=strict)
+    except LookupError:
+        return None
+
+
+def truncations(segment):
+    """
+    'zh-hant-tw' => 'zh-hant-tw', 'zh-hant', 'zh'
+    """
+    yield segment
+    i = None
+    while True:
+        i = segment.rfind('-', 0, i)
+        if i <= 0:
+            return
+        yield segment[:i]
+
+
+class LanguagePrefixDetector(object):
+    """
+    Finds language of first path segment, as django get_language_from_path
+    does, but case-insensitively and by lookup in dicts, precomputed for
+    configured languages, so time doesn't depend on number of languages.
+    """
+
+    def __init__(self, language_codes):
+        # exact language code => language (strict match)
+        self.strict = {}
+        # language code, its generic variants and codes with fallbacks
+        # => language or None (non-strict match)
+        self.variants = {}
+        for code in language_codes:
+            self.strict[code.lower()] = get_variant(code, strict=True)
+            for variant in truncations(code.lower()):
+                self.variants[variant] = None
+        for code, info in LANG_INFO.items():
+            if 'fallback' in info:
+                self.variants[code] = None
+        for variant in self.variants:
+            self.variants[variant] = get_variant(variant, strict=False)
+        # django doesn't look up prefixes of other shape
+        self.strict = dict((code, language) for code, language
+                           in self.strict.items() if is_language_segment(code))
+        self.variants = dict(
+            (code, language) for code, language in self.variants.items()
+            if is_language_segment(code))
+
+    def detect(self, path, strict=False):
+        """
+        Returns (language, path without language prefix, is prefix exact
+        language code). If path has no language prefix, returns
+        (None, path, False).
+        """
+        end = path.find('/', 1)
+        segment = (path[1:] if end == -1 else path[1:end]).lower()
+        if not segment or not path.startswith('/'):
+            return None, path, False
+        is_strict = segment in self.strict
+        if strict:
+            language = self.strict.get(segment)
+        else:
+            language = self.variants.get(segment)
+            if language is None and segment not in self.variants:
+                language = self.detect_unknown(segment)
+        if language is None:
+            return None, path, False
+        return language, path[end:] if end != -1 else '/', is_strict
+
+    def detect_unknown(self, segment):
+        """
+        Segment, which is not configured language code, i.e. 'pt-broughton'
+        is detected as its generic variant ('pt' or 'pt-br').
+        """
+        for variant in truncations(segment):
+            if variant in self.variants:
+                language = self.variants[variant]
+                if language is not None and is_language_segment(segment):
+                    return language
+                return None
+        return None
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from solid_i18n.warmup import warmup
+
+
+class Command(BaseCommand):
+    help = ('Report time of building translation, routing and reverse '
+            'caches for every configured language. Caches are built in '
+            'this process only, use solid_i18n.warmup.warmup to warm '
+            'workers.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--urlconf', action='append', dest='urlconfs',
+            help='Urlconf module to warm (ROOT_URLCONF by default). '
+                 'Can be given several times.')
+
+    def handle(self, *args, **options):
+        timings = warmup(options['urlconfs'])
+        for stage, seconds in timings.items():
+            self.stdout.write('%s: %.3f ms' % (stage, seconds * 1000))
+        self.stdout.write('total: %.3f ms' % (sum(timings.values()) * 1000))
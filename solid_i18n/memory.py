@@ -1,11 +1,26 @@
-from threading import local
+from contextvars import ContextVar
 
-_language_from_path = local()
+# ContextVar instead of threading.local: under asyncio many requests are
+# processed in one thread, but each of them has its own context.
+_language_from_path = ContextVar('solid_i18n_language_from_path', default=None)
 
 
 def set_language_from_path(language):
-    _language_from_path.value = language
+    """
+    Returns token, that must be passed to reset_language_from_path
+    at the end of request.
+    """
+    return _language_from_path.set(language)
 
 
 def get_language_from_path():
-    return getattr(_language_from_path, 'value', None)
+    return _language_from_path.get()
+
+
+def reset_language_from_path(token):
+    try:
+        _language_from_path.reset(token)
+    except ValueError:
+        # token was created in another context, i.e. process_request and
+        # process_response were run by different sync_to_async calls
+        _language_from_path.set(None)
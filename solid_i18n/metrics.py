@@ -0,0 +1,91 @@
+"""
+In-process metrics of SolidLocaleMiddleware, enabled by
+settings.SOLID_I18N_METRICS.
+
+Counters:
+    requests
+    language_source.<path|cookie|header|default>
+    perform_redirect
+    redirects.<language|default_prefix>
+Histograms:
+    middleware_seconds (time, spent in process_request and process_response)
+
+Metrics are kept per process. To export them to own collector, register
+a hook: it is called as hook(kind, name, value), where kind is
+"counter" or "histogram".
+"""
+from collections import defaultdict
+from threading import Lock
+
+# upper bounds of histogram buckets, seconds
+BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+           float('inf'))
+
+
+class Histogram(object):
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.sum += value
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'buckets': [(str(bound), count)
+                        for bound, count in zip(self.buckets, self.counts)],
+        }
+
+
+class Metrics(object):
+
+    def __init__(self):
+        self.counters = defaultdict(int)
+        self.histograms = defaultdict(Histogram)
+        self.hooks = []
+        self._lock = Lock()
+
+    def increment(self, name, value=1):
+        with self._lock:
+            self.counters[name] += value
+        for hook in self.hooks:
+            hook('counter', name, value)
+
+    def observe(self, name, value):
+        with self._lock:
+            self.histograms[name].observe(value)
+        for hook in self.hooks:
+            hook('histogram', name, value)
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook):
+        self.hooks.remove(hook)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'counters': dict(self.counters),
+                'histograms': dict(
+                    (name, histogram.as_dict())
+                    for name, histogram in self.histograms.items()),
+            }
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+
+metrics = Metrics()
@@ -1,34 +1,143 @@
-import re
+import time
 
 from django import VERSION as DJANGO_VERSION
-from django.conf import settings
-from django.urls import is_valid_path, get_script_prefix
-from django.http import HttpResponseRedirect, HttpResponsePermanentRedirect
+from django.core.signals import setting_changed
+from django.urls import get_resolver, get_script_prefix, is_valid_path
+from django.http import (
+    HttpResponseRedirect, HttpResponsePermanentRedirect)
 from django.middleware.locale import LocaleMiddleware
 from django.utils import translation as trans
-from django.utils.cache import patch_vary_headers
-from django.utils.translation.trans_real import language_code_prefix_re
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.translation.trans_real import (
+    language_code_re, parse_accept_lang_header)
 
+from .conf import CONFIG_SETTINGS, get_config
 from .contrib import get_full_path
-from .memory import set_language_from_path
-from .urls import is_language_prefix_patterns_used
+from .lru import LRUCache
+from .memory import reset_language_from_path, set_language_from_path
+from .metrics import metrics
+from .routing import get_routing_table
 
-strict_language_code_prefix_re = re.compile(
-    r"^/({0})(/|$)".format("|".join(map(re.escape, dict(settings.LANGUAGES).keys()))),
-    flags=re.IGNORECASE,
-)
 
+def __getattr__(name):
+    # strict_language_code_prefix_re depends on settings.LANGUAGES,
+    # so it is not compiled at import, but taken from config
+    if name == "strict_language_code_prefix_re":
+        return get_config().strict_prefix_re
+    raise AttributeError(
+        "module {!r} has no attribute {!r}".format(__name__, name))
 
-def get_language_from_path(path):
+
+def get_language_from_path(path, config=None):
     """
-    django.utils.translation wrapper does't allow/pass strict argument
+    Language of path prefix. With SOLID_I18N_PREFIX_STRICT prefix must be
+    exactly one of configured language codes.
     """
-    if settings.USE_I18N:
-        strict = getattr(settings, "SOLID_I18N_PREFIX_STRICT", False)
-        if strict and not strict_language_code_prefix_re.match(path):
-            return None
-        # strict below could possibly be removed since the above is in place
-        return trans.trans_real.get_language_from_path(path, strict=strict)
+    if config is None:
+        config = get_config()
+    if config.use_i18n:
+        return config.prefix_detector.detect(path, config.prefix_strict)[0]
+
+
+SOURCE_PATH = "path"
+SOURCE_COOKIE = "cookie"
+SOURCE_HEADER = "header"
+SOURCE_DEFAULT = "default"
+
+# Accept-Language header, LANGUAGES and LANGUAGE_CODE =>
+# (negotiated language, SOURCE_HEADER or SOURCE_DEFAULT)
+accept_language_cache = LRUCache()
+
+
+def negotiate_accept_language(accept, config):
+    """
+    Cached language negotiation by Accept-Language header value,
+    the same as in django.utils.translation.get_language_from_request.
+    Returns (language, source).
+    """
+    key = (accept, config.languages, config.default_lang)
+    result = accept_language_cache.get(key)
+    if result is None:
+        for accept_lang, unused in parse_accept_lang_header(accept):
+            if accept_lang == "*":
+                break
+            if not language_code_re.search(accept_lang):
+                continue
+            try:
+                result = (
+                    trans.get_supported_language_variant(accept_lang),
+                    SOURCE_HEADER,
+                )
+                break
+            except LookupError:
+                continue
+        if result is None:
+            try:
+                language = trans.get_supported_language_variant(
+                    config.default_lang)
+            except LookupError:
+                language = config.default_lang
+            result = (language, SOURCE_DEFAULT)
+        accept_language_cache.set(key, result)
+    return result
+
+
+def get_language_from_accept_language(accept, config):
+    return negotiate_accept_language(accept, config)[0]
+
+
+PATH_VALID = "valid"
+PATH_NEEDS_SLASH = "needs_slash"
+PATH_INVALID = "invalid"
+
+# (urlconf, language, path) => (resolver, path validity)
+valid_path_cache = LRUCache()
+
+
+def get_path_validity(path, urlconf, language, config):
+    """
+    Cached check, that path (or path with appended slash) can be resolved.
+    Result is bound to resolver, so it is invalidated by clear_url_caches.
+    """
+    key = (urlconf, language, path)
+    resolver = get_resolver(urlconf)
+    cached = valid_path_cache.get(key)
+    if cached is not None and cached[0] is resolver:
+        return cached[1]
+    if is_valid_path(path, urlconf):
+        validity = PATH_VALID
+    elif (
+        config.append_slash
+        and not path.endswith("/")
+        and is_valid_path("%s/" % path, urlconf)
+    ):
+        validity = PATH_NEEDS_SLASH
+    else:
+        validity = PATH_INVALID
+    valid_path_cache.set(key, (resolver, validity))
+    return validity
+
+
+class PathResolution(object):
+    """
+    Language information, found by SolidLocaleMiddleware.process_request.
+    Stored in request, so process_response and perform_redirect don't
+    have to search it again.
+    """
+    __slots__ = ('urlconf', 'routing', 'prefix_patterns_used',
+                 'language_from_path', 'memory_token', 'language_source',
+                 'vary_headers', 'elapsed')
+
+    def __init__(self, urlconf, routing, language_from_path):
+        self.urlconf = urlconf
+        self.routing = routing
+        self.prefix_patterns_used = routing.prefix_patterns_used
+        self.language_from_path = language_from_path
+        self.memory_token = None
+        self.language_source = None
+        # request headers, that negotiated language depends on
+        self.vary_headers = ()
+        self.elapsed = 0.0
 
 
 class SolidLocaleMiddleware(LocaleMiddleware):
@@ -46,85 +155,241 @@ class SolidLocaleMiddleware(LocaleMiddleware):
 
     response_redirect_class = HttpResponseRedirect
     response_default_language_redirect_class = HttpResponsePermanentRedirect
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, *args, **kwargs):
+        super(SolidLocaleMiddleware, self).__init__(*args, **kwargs)
+        self.config = get_config()
+        self.metrics = metrics if self.config.metrics else None
+        accept_language_cache.resize(self.config.accept_language_cache_size)
+        valid_path_cache.resize(self.config.valid_path_cache_size)
+        setting_changed.connect(self.update_config)
+
+    def update_config(self, setting, **kwargs):
+        """
+        Take rebuilt shared settings snapshot, when one of used settings
+        is changed (i.e. by override_settings in tests).
+        """
+        if setting in CONFIG_SETTINGS:
+            self.config = get_config()
+            self.metrics = metrics if self.config.metrics else None
+            accept_language_cache.resize(self.config.accept_language_cache_size)
+            valid_path_cache.resize(self.config.valid_path_cache_size)
+            valid_path_cache.clear()
+            if setting in ("LANGUAGES", "LANGUAGE_CODE"):
+                accept_language_cache.clear()
+
+    async def __acall__(self, request):
+        """
+        Async version of __call__. Language detection doesn't do any IO,
+        so process_request and process_response are called directly,
+        without moving them to thread by sync_to_async.
+        """
+        response = self.process_request(request)
+        response = response or await self.get_response(request)
+        return self.process_response(request, response)
 
     @property
     def use_redirects(self):
-        return getattr(settings, "SOLID_I18N_USE_REDIRECTS", False)
+        return self.config.use_redirects
 
     @property
     def default_lang(self):
-        return settings.LANGUAGE_CODE
+        return self.config.default_lang
+
+    def resolve_path(self, request):
+        """
+        Return PathResolution of request, stored by process_request.
+        If process_request was not called for that request (i.e. some previous
+        middleware returned response), resolve it here.
+        """
+        resolution = getattr(request, "solid_i18n_resolution", None)
+        if resolution is None:
+            config = self.config
+            urlconf = getattr(request, "urlconf", config.root_urlconf)
+            resolution = PathResolution(
+                urlconf,
+                get_routing_table(urlconf),
+                get_language_from_path(request.path_info, config),
+            )
+            request.solid_i18n_resolution = resolution
+        return resolution
+
+    def get_language_from_request(self, request, resolution):
+        """
+        Same as django.utils.translation.get_language_from_request, but
+        language from path is taken from resolution, header from
+        SOLID_I18N_VARY_HEADER is used instead of Accept-Language, if present,
+        and negotiation result is cached. Source of the language is stored
+        in resolution.language_source.
+        """
+        if resolution.prefix_patterns_used and resolution.language_from_path:
+            resolution.language_source = SOURCE_PATH
+            return resolution.language_from_path
+        lang_code = request.COOKIES.get(self.config.language_cookie_name)
+        if lang_code is not None:
+            if lang_code in trans.trans_real.get_languages() and (
+                trans.check_for_language(lang_code)
+            ):
+                resolution.language_source = SOURCE_COOKIE
+                return lang_code
+            try:
+                lang_code = trans.get_supported_language_variant(lang_code)
+                resolution.language_source = SOURCE_COOKIE
+                return lang_code
+            except LookupError:
+                pass
+        # normalized language header (i.e. set by CDN), if configured
+        accept = request.META.get(self.config.vary_header_meta)
+        resolution.vary_headers = (self.config.vary_header,)
+        if accept is None:
+            accept = request.META.get("HTTP_ACCEPT_LANGUAGE", "")
+            # response for request without configured header depends
+            # on Accept-Language too
+            resolution.vary_headers += ("Accept-Language",)
+        language, resolution.language_source = negotiate_accept_language(
+            accept, self.config
+        )
+        return language
 
     def process_request(self, request):
-        urlconf = getattr(request, "urlconf", settings.ROOT_URLCONF)
-        check_path = is_language_prefix_patterns_used(urlconf)
-        language_path = get_language_from_path(request.path_info)
+        if request.path_info.startswith(self.config.exclude_prefixes):
+            # language of previous request in this thread must not leak
+            trans.deactivate()
+            return None
+        if self.metrics is not None:
+            started = time.perf_counter()
+        config = self.config
+        resolution = self.resolve_path(request)
+        check_path = resolution.prefix_patterns_used
+        language_path = resolution.language_from_path
 
-        if check_path and not self.use_redirects:
-            language = language_path or self.default_lang
+        if check_path and not config.use_redirects:
+            language = language_path or config.default_lang
+            resolution.language_source = (
+                SOURCE_PATH if language_path else SOURCE_DEFAULT
+            )
         else:
-            language = trans.get_language_from_request(request, check_path)
+            language = self.get_language_from_request(request, resolution)
 
-        set_language_from_path(language_path)
+        resolution.memory_token = set_language_from_path(language_path)
         trans.activate(language)
         request.LANGUAGE_CODE = trans.get_language()
 
-    def process_response(self, request, response):
-        language = trans.get_language()
-        language_from_path = get_language_from_path(request.path_info)
-        urlconf = getattr(request, "urlconf", settings.ROOT_URLCONF)
-        i18n_patterns_used = is_language_prefix_patterns_used(urlconf)
-
-        if (
-            getattr(settings, "SOLID_I18N_DEFAULT_PREFIX_REDIRECT", False)
-            and language_from_path == self.default_lang
-            and i18n_patterns_used
-        ):
+        redirect = redirect_type = None
+        if self.is_default_prefixed(resolution):
+            # redirect before the view is executed; process_response
+            # will be called for redirect and will skip it
             redirect = self.perform_redirect(request, "", is_permanent=True)
+            redirect_type = "default_prefix"
+        elif (
+            config.eager_redirects
+            and config.use_redirects
+            and request.method in ("GET", "HEAD")
+            and check_path
+            and not language_path
+            and language != config.default_lang
+        ):
+            # don't wait for 404 of the view, if prefixed path is valid
+            # (result of validation is cached); other methods reach the
+            # view, it may handle unprefixed path
+            redirect = self.perform_redirect(request, language)
+            redirect_type = "language"
+        if self.metrics is not None:
+            self.metrics.increment("requests")
+            self.metrics.increment(
+                "language_source.%s" % resolution.language_source
+            )
             if redirect:
-                return redirect
-        elif self.use_redirects:
-            if (
-                response.status_code == 404
-                and not language_from_path
-                and i18n_patterns_used
-                and language != self.default_lang
-            ):
-                redirect = self.perform_redirect(request, language)
-                if redirect:
-                    return redirect
-            if not (i18n_patterns_used and language_from_path):
-                patch_vary_headers(response, ("Accept-Language",))
-        if "Content-Language" not in response:
-            response["Content-Language"] = language
-        return response
+                self.metrics.increment("redirects.%s" % redirect_type)
+            resolution.elapsed = time.perf_counter() - started
+        return redirect
+
+    def is_default_prefixed(self, resolution):
+        """
+        Path has default language prefix, that must be redirected
+        to path without prefix.
+        """
+        config = self.config
+        return (
+            config.default_prefix_redirect
+            and resolution.language_from_path == config.default_lang
+            and resolution.prefix_patterns_used
+        )
+
+    def process_response(self, request, response):
+        if request.path_info.startswith(self.config.exclude_prefixes):
+            return response
+        if self.metrics is not None:
+            started = time.perf_counter()
+        config = self.config
+        language = trans.get_language()
+        resolution = self.resolve_path(request)
+        try:
+            language_from_path = resolution.language_from_path
+            i18n_patterns_used = resolution.prefix_patterns_used
+
+            if config.use_redirects and not self.is_default_prefixed(resolution):
+                if (
+                    response.status_code == 404
+                    and not language_from_path
+                    and i18n_patterns_used
+                    and language != config.default_lang
+                ):
+                    redirect = self.perform_redirect(request, language)
+                    if redirect:
+                        if self.metrics is not None:
+                            self.metrics.increment("redirects.language")
+                        # redirect depends on negotiated language as well
+                        patch_vary_headers(redirect, self.get_vary_headers(
+                            resolution))
+                        return redirect
+                if not (i18n_patterns_used and language_from_path):
+                    patch_vary_headers(
+                        response, self.get_vary_headers(resolution))
+            if "Content-Language" not in response:
+                response["Content-Language"] = language
+            if config.language_header:
+                # value is appended, so header can be used as surrogate keys
+                keys = response.get(config.language_header)
+                response[config.language_header] = (
+                    "%s %s" % (keys, language) if keys else language
+                )
+            return response
+        finally:
+            if resolution.memory_token is not None:
+                reset_language_from_path(resolution.memory_token)
+                resolution.memory_token = None
+            if self.metrics is not None:
+                self.metrics.observe(
+                    "middleware_seconds",
+                    resolution.elapsed + time.perf_counter() - started,
+                )
+
+    def get_vary_headers(self, resolution):
+        # language can be taken from cookie, then headers were not read
+        return resolution.vary_headers or (self.config.vary_header,)
 
     def remove_lang_from_path(self, path):
-        no_lang_tag_path = path
-        regex_match = language_code_prefix_re.match(path)
-        if regex_match:
-            lang_code = regex_match.group(1)
-            no_lang_tag_path = path[1 + len(lang_code) :]
-            if not no_lang_tag_path.startswith("/"):
-                no_lang_tag_path = "/" + no_lang_tag_path
-        return no_lang_tag_path
+        config = self.config
+        return config.prefix_detector.detect(path, config.prefix_strict)[1]
 
     def perform_redirect(self, request, language, is_permanent=False):
         # language can be empty string (in case of default language)
+        if self.metrics is not None:
+            self.metrics.increment("perform_redirect")
 
         path_info = request.path_info
         if not language:
             path_info = self.remove_lang_from_path(path_info)
-        urlconf = getattr(request, "urlconf", None)
+        urlconf = self.resolve_path(request).urlconf
         language_path = "%s%s" % (language, path_info)
         if not language_path.startswith("/"):
             language_path = "/" + language_path
-        path_valid = is_valid_path(language_path, urlconf)
-        path_needs_slash = not path_valid and (
-            settings.APPEND_SLASH
-            and not language_path.endswith("/")
-            and is_valid_path("%s/" % language_path, urlconf)
-        )
+        validity = get_path_validity(language_path, urlconf, language, self.config)
+        path_valid = validity == PATH_VALID
+        path_needs_slash = validity == PATH_NEEDS_SLASH
 
         if path_valid or path_needs_slash:
             script_prefix = get_script_prefix()
@@ -133,7 +398,10 @@ class SolidLocaleMiddleware(LocaleMiddleware):
             else:
                 full_path = request.get_full_path(force_append_slash=path_needs_slash)
             if not language:
-                full_path = self.remove_lang_from_path(full_path)
+                # language prefix follows script prefix
+                full_path = script_prefix + self.remove_lang_from_path(
+                    full_path[len(script_prefix) - 1 :]
+                )[1:]
             language_url = full_path.replace(
                 script_prefix,
                 "%s%s/" % (script_prefix, language) if language else script_prefix,
@@ -142,6 +410,9 @@ class SolidLocaleMiddleware(LocaleMiddleware):
 
             # return a 301 permanent redirect if on default language
             if is_permanent:
-                return self.response_default_language_redirect_class(language_url)
+                redirect = self.response_default_language_redirect_class(language_url)
             else:
-                return self.response_redirect_class(language_url)
+                redirect = self.response_redirect_class(language_url)
+            if self.config.redirect_cache_control:
+                patch_cache_control(redirect, **self.config.redirect_cache_control)
+            return redirect
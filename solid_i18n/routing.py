@@ -0,0 +1,59 @@
+"""
+Registry of language routing tables, compiled once per urlconf.
+
+With many urlconfs (i.e. `request.urlconf` set per host) middleware and
+url helpers look up compiled table instead of scanning resolver patterns.
+"""
+from collections import namedtuple
+
+from django.urls import get_resolver
+
+from .conf import get_config
+from .lru import LRUCache
+from .urlresolvers import SolidLocalePrefixPattern
+
+RoutingTable = namedtuple('RoutingTable', (
+    'resolver',
+    # settings snapshot, table is compiled with
+    'config',
+    # urlconf has SolidLocalePrefixPattern at root level
+    'prefix_patterns_used',
+))
+
+# urlconf => RoutingTable, size is set by
+# SOLID_I18N_PREFIX_PATTERNS_CACHE_SIZE on first compilation
+routing_tables = LRUCache(maxsize=1000)
+
+
+def compile_routing_table(resolver, config):
+    patterns = tuple(
+        url_pattern.pattern for url_pattern in resolver.url_patterns
+        if isinstance(url_pattern.pattern, SolidLocalePrefixPattern))
+    for pattern in patterns:
+        # build match and regex tables before first request
+        pattern.tables
+    if patterns:
+        patterns[0].install_reverse_dicts(resolver)
+    return RoutingTable(
+        resolver=resolver,
+        config=config,
+        prefix_patterns_used=bool(patterns),
+    )
+
+
+def get_routing_table(urlconf=None):
+    """
+    Compiled RoutingTable of urlconf. It is bound to resolver and settings
+    snapshot, so it is recompiled after clear_url_caches or settings change.
+    """
+    resolver = get_resolver(urlconf)
+    config = get_config()
+    table = routing_tables.get(urlconf)
+    if table is None or table.resolver is not resolver or (
+            table.config is not config):
+        table = compile_routing_table(resolver, config)
+        if routing_tables.maxsize != config.prefix_patterns_cache_size:
+            # size follows settings without middleware, i.e. in tasks
+            routing_tables.resize(config.prefix_patterns_cache_size)
+        routing_tables.set(urlconf, table)
+    return table
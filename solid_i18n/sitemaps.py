@@ -0,0 +1,96 @@
+from django.contrib.sitemaps import Sitemap
+from django.core.paginator import Paginator
+from django.urls import get_script_prefix
+from django.utils import translation
+
+from .conf import get_config
+from .memory import reset_language_from_path, set_language_from_path
+
+
+class SolidI18nSitemap(Sitemap):
+    """
+    Sitemap for urls inside solid_i18n_patterns. Every item is listed for
+    every language, with alternates for all languages and x-default.
+    Default language urls are without prefix.
+
+    Location of item is found once, for default language. Urls of
+    other languages are made by adding language prefix to it, so url
+    patterns must not be translated.
+
+    Items are paginated before they are combined with languages, so
+    only one page of items is loaded, and urls are generated lazily.
+    """
+    i18n = True
+    alternates = True
+    x_default = True
+
+    @property
+    def paginator(self):
+        per_page = max(1, self.limit // max(1, len(self._languages())))
+        return Paginator(self.items(), per_page)
+
+    def get_default_location(self, item):
+        """
+        Location of item for default language, without language prefix.
+        """
+        token = set_language_from_path(None)
+        try:
+            with translation.override(get_config().default_lang):
+                return self.location(item)
+        finally:
+            reset_language_from_path(token)
+
+    def languages_for_item(self, item):
+        # get_languages_for_item appeared in django 4.2
+        if hasattr(self, 'get_languages_for_item'):
+            return self.get_languages_for_item(item)
+        return self._languages()
+
+    def _urls(self, page, protocol, domain):
+        return self.iter_urls(page, protocol, domain)
+
+    def iter_urls(self, page, protocol, domain):
+        config = get_config()
+        prefixes = dict(config.language_prefixes)
+        site_url = '%s://%s%s' % (protocol, domain, get_script_prefix())
+        latest_lastmod = None
+        all_items_lastmod = True
+
+        for obj in self.paginator.page(page).object_list:
+            path = self.get_default_location(obj)[len(get_script_prefix()):]
+            locations = [
+                (lang_code, site_url + prefixes.get(lang_code, '%s/' % lang_code) + path)
+                for lang_code in self.languages_for_item(obj)
+            ]
+            alternates = []
+            if self.alternates:
+                alternates = [
+                    {'location': location, 'lang_code': lang_code}
+                    for lang_code, location in locations
+                ]
+                if self.x_default and config.default_lang in dict(locations):
+                    alternates.append({
+                        'location': site_url + path,
+                        'lang_code': 'x-default',
+                    })
+            for lang_code, location in locations:
+                item = (obj, lang_code)
+                priority = self._get('priority', item)
+                lastmod = self._get('lastmod', item)
+                if all_items_lastmod:
+                    all_items_lastmod = lastmod is not None
+                    if all_items_lastmod and (
+                        latest_lastmod is None or lastmod > latest_lastmod
+                    ):
+                        latest_lastmod = lastmod
+                yield {
+                    'item': item,
+                    'location': location,
+                    'lastmod': lastmod,
+                    'changefreq': self._get('changefreq', item),
+                    'priority': str(priority if priority is not None else ''),
+                    'alternates': alternates,
+                }
+
+        if all_items_lastmod and latest_lastmod:
+            self.latest_lastmod = latest_lastmod
@@ -0,0 +1,56 @@
+from django import template
+from django.utils.encoding import escape_uri_path, iri_to_uri
+from django.utils.html import format_html_join
+
+from ..alternates import get_alternates, translate_url_all
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def get_alternate_urls(context):
+    """
+    Usage:
+
+        {% get_alternate_urls as alternates %}
+        {% for language, url in alternates %}...{% endfor %}
+    """
+    request = context.get('request')
+    if request is None:
+        return ()
+    return get_alternates(request)
+
+
+@register.simple_tag(takes_context=True)
+def alternate_links(context):
+    """
+    Renders <link rel="alternate" hreflang="..." href="..."> for every
+    language and x-default. Requires request in template context.
+    """
+    request = context.get('request')
+    if request is None:
+        return ''
+    return format_html_join(
+        '\n', '<link rel="alternate" hreflang="{}" href="{}">',
+        ((language, request.build_absolute_uri(url))
+         for language, url in get_alternates(request)))
+
+
+@register.simple_tag(takes_context=True)
+def translate_urls(context, url=None):
+    """
+    Urls of given url (or current page) for every language, i.e. for
+    language switcher:
+
+        {% translate_urls as language_urls %}
+        <a href="{{ language_urls.ru }}">RU</a>
+    """
+    if url is None:
+        request = context.get('request')
+        if request is None:
+            return {}
+        # path_info is used as script prefix is added back on reverse
+        url = escape_uri_path(request.path_info)
+        if request.META.get('QUERY_STRING'):
+            url += '?' + iri_to_uri(request.META['QUERY_STRING'])
+    return translate_url_all(url, getattr(context.get('request'), 'urlconf', None))
@@ -1,7 +1,10 @@
 import re
+from collections import namedtuple
 from django.utils.translation import get_language
-from django.urls import clear_url_caches
+from django.urls import clear_url_caches, get_resolver, get_urlconf
 from django.conf import settings
+from django.core.signals import setting_changed
+from .conf import CONFIG_SETTINGS, get_config
 from .memory import get_language_from_path
 from django.urls import LocalePrefixPattern
 
@@ -9,6 +12,12 @@ from django.urls import LocalePrefixPattern
 #         NoReverseMatch, URLPattern as RegexURLPattern, URLResolver as RegexURLResolver, ResolverMatch, Resolver404, get_script_prefix, reverse, reverse_lazy, resolve
 # )
 
+DEFAULT_PREFIXED = 'default_prefixed'
+
+# Precomputed state of SolidLocalePrefixPattern. It is never changed,
+# but replaced as a whole on settings change.
+PatternTables = namedtuple('PatternTables', ('config', 'match', 'regex'))
+
 
 class SolidLocalePrefixPattern(LocalePrefixPattern):
     """
@@ -21,8 +30,57 @@ class SolidLocalePrefixPattern(LocalePrefixPattern):
 
     def __init__(self, prefix_default_language, *args, **kwargs):
         super(SolidLocalePrefixPattern, self).__init__(False, *args, **kwargs)
-        self.compiled_with_default = False
-        self._regex_dict = {}
+        self._tables = None
+        setting_changed.connect(self.settings_changed)
+
+    def settings_changed(self, setting, **kwargs):
+        if setting in CONFIG_SETTINGS:
+            self._tables = None
+
+    @property
+    def tables(self):
+        tables = self._tables
+        if tables is None:
+            tables = self.build_tables()
+        return tables
+
+    def build_tables(self):
+        """
+        Precompute match rules and compiled regexes for every supported
+        language, so match and regex don't read settings and don't write
+        anything, when processing requests. Tables are built on first use.
+        """
+        config = get_config()
+        match_table = {}
+        regex_table = {}
+        for language_code in config.languages | {config.default_lang}:
+            match_table[language_code] = self.get_match_rule(
+                language_code, config)
+            regex_table[language_code] = self.compile_regex(
+                language_code, language_code, config)
+        if config.handle_default_prefix:
+            key = (config.default_lang, DEFAULT_PREFIXED)
+            regex_table[key] = self.compile_regex(
+                config.default_lang, key, config)
+        self._tables = PatternTables(config, match_table, regex_table)
+        return self._tables
+
+    def get_match_rule(self, language_code, config):
+        """
+        Returns tuple:
+        (language prefix,
+         is path equal to prefix not matched,
+         is path without prefix not matched)
+        """
+        is_default = (
+            language_code == config.default_lang
+            and not self.prefix_default_language
+        )
+        return (
+            "%s/" % language_code,
+            is_default and not config.handle_default_prefix,
+            not is_default and config.use_redirects,
+        )
 
     # @property
     # def regex(self):
@@ -37,27 +95,71 @@ class SolidLocalePrefixPattern(LocalePrefixPattern):
         # else:
         return "%s/" % language_code
 
+    def compile_regex(self, language_code, key, config):
+        if language_code != config.default_lang or key != language_code:
+            return re.compile("^%s/" % language_code, re.UNICODE)
+        return re.compile("", re.UNICODE)
+
     def match(self, path):
-        language_code = get_language() or settings.LANGUAGE_CODE
-        language_prefix = self.language_prefix
-
-        if language_code == settings.LANGUAGE_CODE and not self.prefix_default_language:
-            if path == language_code + "/":
-                if not settings.SOLID_I18N_HANDLE_DEFAULT_PREFIX:
-                    return None
-        #      clear_url_caches()
-        language_prefix = self.language_prefix
+        tables = self.tables
+        language_code = get_language() or tables.config.default_lang
+        rule = tables.match.get(language_code)
+        if rule is None:
+            rule = self.get_match_rule(language_code, tables.config)
+        language_prefix, exact_prefix_not_matched, no_prefix_not_matched = rule
         if path.startswith(language_prefix):
+            if exact_prefix_not_matched and path == language_prefix:
+                return None
             return path[len(language_prefix) :], (), {}
-        if (
-            language_code != settings.LANGUAGE_CODE
-            and settings.SOLID_I18N_USE_REDIRECTS is True
-        ):
+        if no_prefix_not_matched:
             return None
-        return path[0:], (), {}
+        return path, (), {}
 
     #  return None
 
+    def reverse_key(self, language_code):
+        """
+        Key of reverse data for given language. Default language has
+        separate reverse data for urls with prefix and without it,
+        if SOLID_I18N_HANDLE_DEFAULT_PREFIX is True.
+        """
+        return self._reverse_key(language_code, self.tables.config)
+
+    def _reverse_key(self, language_code, config):
+        if (
+            config.handle_default_prefix
+            and language_code == config.default_lang
+            and get_language_from_path() == language_code
+        ):
+            return (language_code, DEFAULT_PREFIXED)
+        return language_code
+
+    def install_reverse_dicts(self, resolver):
+        """
+        Make root resolver keep its reverse data by reverse_key
+        instead of language code.
+        """
+        if not isinstance(resolver._reverse_dict, ReverseKeyDict):
+            resolver._namespace_dict = ReverseKeyDict(self)
+            resolver._app_dict = ReverseKeyDict(self)
+            resolver._reverse_dict = ReverseKeyDict(self)
+            resolver._populated = False
+
+    def install_to_populating_resolver(self):
+        """
+        regex is read by root resolver, when it populates its reverse data.
+        Install ReverseKeyDict to that resolver, so reverse() keeps prefixed
+        and unprefixed default language apart without middleware
+        (i.e. in shell, tasks or right after clear_url_caches).
+        """
+        resolver = get_resolver(get_urlconf())
+        if (
+            getattr(resolver._local, "populating", False)
+            and not isinstance(resolver._reverse_dict, ReverseKeyDict)
+            and any(p.pattern is self for p in resolver.url_patterns)
+        ):
+            self.install_reverse_dicts(resolver)
+
     @property
     def regex(self):
         """
@@ -71,46 +173,35 @@ class SolidLocalePrefixPattern(LocalePrefixPattern):
         Otherwise, all other urls will be reversed without default langauge
         prefix.
         """
-        #  import pdb
+        self.install_to_populating_resolver()
+        tables = self.tables
+        language_code = get_language() or tables.config.default_lang
+        key = self._reverse_key(language_code, tables.config)
+        regex = tables.regex.get(key)
+        if regex is None:
+            # language is not in settings.LANGUAGES
+            regex = self.compile_regex(language_code, key, tables.config)
+        return regex
 
-        #  pdb.set_trace()
-        #
-        language_code = get_language()
-        handle_default_prefix = getattr(
-            settings, "SOLID_I18N_HANDLE_DEFAULT_PREFIX", False
-        )
-        if language_code not in self._regex_dict:
-            if language_code != settings.LANGUAGE_CODE:
-                regex = "^%s/" % language_code
-            elif handle_default_prefix:
-                if get_language_from_path() == settings.LANGUAGE_CODE:
-                    self.compiled_with_default = True
-                    regex = "^%s/" % language_code
-                else:
-                    self.compiled_with_default = False
-                    regex = ""
-            else:
-                regex = ""
-            self._regex_dict[language_code] = re.compile(regex, re.UNICODE)
-        elif handle_default_prefix and language_code == settings.LANGUAGE_CODE:
-            language_from_path = get_language_from_path()
-            regex = None
-            if self.compiled_with_default and not language_from_path:
-                # default language is compiled with prefix, but now client
-                # requests the url without prefix. So compile other urls
-                # without prefix.
-                regex = ""
-                self.compiled_with_default = False
-            elif (
-                not self.compiled_with_default
-                and language_from_path == settings.LANGUAGE_CODE
-            ):
-                # default language is compiled without prefix, but now client
-                # requests the url with prefix. So compile other urls
-                # with prefix.
-                regex = "^%s/" % language_code
-                self.compiled_with_default = True
-            if regex is not None:
-                # clear_url_caches()
-                self._regex_dict[language_code] = re.compile(regex, re.UNICODE)
-        return self._regex_dict[language_code]
+
+class ReverseKeyDict(dict):
+    """
+    Dict for URLResolver reverse data, that is accessed by language code,
+    but stores values by SolidLocalePrefixPattern.reverse_key.
+    """
+
+    def __init__(self, pattern):
+        super(ReverseKeyDict, self).__init__()
+        self.pattern = pattern
+
+    def __contains__(self, language_code):
+        return super(ReverseKeyDict, self).__contains__(
+            self.pattern.reverse_key(language_code))
+
+    def __getitem__(self, language_code):
+        return super(ReverseKeyDict, self).__getitem__(
+            self.pattern.reverse_key(language_code))
+
+    def __setitem__(self, language_code, value):
+        super(ReverseKeyDict, self).__setitem__(
+            self.pattern.reverse_key(language_code), value)
@@ -1,9 +1,11 @@
 from django.conf import settings
 
-# from django.utils import lru_cache, six
-import functools
-from django.urls import URLResolver, get_resolver
+from django.urls import URLResolver, get_script_prefix, reverse
+from django.utils import translation
 
+from .memory import reset_language_from_path, set_language_from_path
+from .middleware import valid_path_cache
+from .routing import get_routing_table, routing_tables
 from .urlresolvers import SolidLocalePrefixPattern
 
 
@@ -27,13 +29,79 @@ def solid_i18n_patterns(*urls, prefix_default_language=True):
     ]
 
 
-@functools.lru_cache(maxsize=None)
+# compiled routing tables are cached per urlconf
+prefix_patterns_cache = routing_tables
+
+
 def is_language_prefix_patterns_used(urlconf):
     """
     Returns `True` if the `SolidLocaleRegexURLResolver` is used
     at root level of the urlpatterns, else it returns `False`.
+
+    Result is taken from compiled routing table of urlconf, which is
+    invalidated by clear_url_caches.
+    """
+    return get_routing_table(urlconf).prefix_patterns_used
+
+
+def clear_prefix_patterns_cache():
     """
-    for url_pattern in get_resolver(urlconf).url_patterns:
-        if isinstance(url_pattern.pattern, SolidLocalePrefixPattern):
-            return True
-    return False
+    Clear routing tables and path validity cache, so entries of old
+    resolvers don't keep them in memory until they are evicted.
+    """
+    prefix_patterns_cache.clear()
+    valid_path_cache.clear()
+
+
+# same interface, as functools.lru_cache had
+is_language_prefix_patterns_used.cache_clear = clear_prefix_patterns_cache
+is_language_prefix_patterns_used.cache_info = prefix_patterns_cache.info
+
+
+def reverse_all_languages(viewname, urlconf=None, args=None, kwargs=None,
+                          current_app=None):
+    """
+    Returns {language code: url} for every language in settings.LANGUAGES,
+    default language url is without prefix.
+
+    Url is reversed for default language and for one more language only:
+    if it is inside solid_i18n_patterns, urls for other languages are made
+    by adding language prefix. Url patterns must not be translated.
+    """
+    # compiled table also makes sure, that root resolver keeps reverse data
+    # of prefixed and unprefixed default language separately
+    table = get_routing_table(urlconf)
+    config = table.config
+    language_prefixes = table.config.language_prefixes
+    probe_language = next(
+        (code for code, prefix in language_prefixes if prefix), None)
+    token = set_language_from_path(None)
+    try:
+        with translation.override(config.default_lang):
+            url = reverse(viewname, urlconf, args, kwargs, current_app)
+        if probe_language is None:
+            return dict((code, url) for code, prefix in language_prefixes)
+        with translation.override(probe_language):
+            probe_url = reverse(viewname, urlconf, args, kwargs, current_app)
+    finally:
+        reset_language_from_path(token)
+
+    if probe_url == url:
+        # url is not inside solid_i18n_patterns
+        return dict((code, url) for code, prefix in language_prefixes)
+    script_prefix = get_script_prefix()
+    path = url[len(script_prefix):]
+    if probe_url == "%s%s/%s" % (script_prefix, probe_language, path):
+        return dict(
+            (code, script_prefix + prefix + path)
+            for code, prefix in language_prefixes)
+    # unexpected url structure, i.e. translated url patterns
+    urls = {}
+    token = set_language_from_path(None)
+    try:
+        for code, prefix in language_prefixes:
+            with translation.override(code):
+                urls[code] = reverse(viewname, urlconf, args, kwargs, current_app)
+    finally:
+        reset_language_from_path(token)
+    return urls
@@ -0,0 +1,67 @@
+"""
+Eager building of caches, that are otherwise built on first requests:
+gettext catalogs, compiled routing tables and per-language reverse data
+of resolvers.
+
+Call `warmup()` in wsgi/asgi module with gunicorn `preload_app`, so warm
+state is shared copy-on-write by workers, or in `post_fork` hook.
+"""
+import time
+from collections import OrderedDict
+
+from django.utils import translation as trans
+
+from .conf import get_config
+from .memory import reset_language_from_path, set_language_from_path
+from .routing import get_routing_table
+
+
+def warm_translations(config, urlconfs):
+    for language in sorted(config.languages | {config.default_lang}):
+        trans.trans_real.translation(language)
+
+
+def warm_routing(config, urlconfs):
+    for urlconf in urlconfs:
+        get_routing_table(urlconf)
+
+
+def warm_reverse(config, urlconfs):
+    # (active language, language from path) combinations,
+    # which are kept separately in reverse data
+    variants = [(language, None) for language in sorted(config.languages)]
+    if config.handle_default_prefix:
+        variants.append((config.default_lang, config.default_lang))
+    for urlconf in urlconfs:
+        resolver = get_routing_table(urlconf).resolver
+        for language, language_from_path in variants:
+            token = set_language_from_path(language_from_path)
+            try:
+                with trans.override(language):
+                    resolver.reverse_dict
+                    resolver.namespace_dict
+                    resolver.app_dict
+            finally:
+                reset_language_from_path(token)
+
+
+STAGES = (
+    ('translations', warm_translations),
+    ('routing', warm_routing),
+    ('reverse', warm_reverse),
+)
+
+
+def warmup(urlconfs=None):
+    """
+    Warm caches for every configured language and given urlconfs
+    (ROOT_URLCONF by default). Returns {stage: seconds}.
+    """
+    config = get_config()
+    urlconfs = list(urlconfs or [config.root_urlconf])
+    timings = OrderedDict()
+    for name, stage in STAGES:
+        started = time.perf_counter()
+        stage(config, urlconfs)
+        timings[name] = time.perf_counter() - started
+    return timings